@@ -55,6 +55,12 @@ class Config:
     HF_CLEANED_REPO = os.getenv('HF_CLEANED_REPO', 'Mozhii-AI/Cleaned')
     HF_CHUNKED_REPO = os.getenv('HF_CHUNKED_REPO', 'Mozhii-AI/Chunk')
     
+    # Maximum number of raw/cleaned files uploaded concurrently during a push
+    HF_UPLOAD_WORKERS = int(os.getenv('HF_UPLOAD_WORKERS', '8'))
+    
+    # Maximum number of HuggingFace commits in flight per process
+    HF_MAX_CONCURRENT_COMMITS = int(os.getenv('HF_MAX_CONCURRENT_COMMITS', '8'))
+    
     # -------------------------------------------------------------------------
     # File Storage Paths
     # -------------------------------------------------------------------------
@@ -82,6 +88,17 @@ class Config:
     # IMPORTANT: Change this in production and use proper authentication!
     ADMIN_PASSWORD = os.getenv('ADMIN_PASSWORD', 'admin123')
     
+    # Parsed JSON files kept per worker for the admin listings. Each listing
+    # reads every meta/chunk file in order, so once there are more files
+    # than this the LRU evicts each entry before it is read again and never
+    # hits; size it above the pending + approved JSON file count.
+    ADMIN_JSON_CACHE_SIZE = int(os.getenv('ADMIN_JSON_CACHE_SIZE', '4096'))
+    
+    # Directory listings kept per worker, one per scanned directory (every
+    # chunk folder plus the stage directories). Past this many directories
+    # the chunk listings rescan everything on each poll.
+    ADMIN_DIR_CACHE_SIZE = int(os.getenv('ADMIN_DIR_CACHE_SIZE', '4096'))
+    
     # -------------------------------------------------------------------------
     # Supported Languages
     # -------------------------------------------------------------------------
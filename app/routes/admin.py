@@ -12,7 +12,7 @@ Admin Responsibilities:
     5. Manage platform configuration
 
 Endpoints:
-    GET  /api/admin/pending          - Get all pending items
+    GET  /api/admin/pending          - Get all pending items (?format=jsonl to stream)
     GET  /api/admin/item             - Get a specific pending item for editing
     POST /api/admin/update           - Update a pending item
     POST /api/admin/approve          - Approve a submission
@@ -24,17 +24,629 @@ Endpoints:
 =============================================================================
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 import os
+import errno
+import hashlib
 import json
+import re
 import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+from ..config import Config
+from ..services.huggingface import HuggingFaceService
+from .chunking import _chunk_lock
+
+# orjson parses/serializes several times faster than the stdlib encoder and
+# already emits UTF-8 without ASCII escaping. Fall back to ujson, then json.
+# _json_dumps / _json_dumps_compact always return UTF-8 encoded bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _json_dumps_compact(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+
+        def _json_dumps(obj):
+            return ujson.dumps(obj, indent=2, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+        def _json_dumps_compact(obj):
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+    except ImportError:
+        _json_loads = json.loads
+
+        def _json_dumps(obj):
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+        def _json_dumps_compact(obj):
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
 admin_bp = Blueprint('admin', __name__)
 
+# -----------------------------------------------------------------------------
+# Path Templates
+# -----------------------------------------------------------------------------
+# Bound str.__mod__ builders: cheaper per call than re-evaluating f-strings.
+_TXT_FMT = '%s.txt'.__mod__
+_META_FMT = '%s.meta.json'.__mod__
+_CHUNK_FMT = 'chunk_%02d.json'.__mod__
+
+# -----------------------------------------------------------------------------
+# Stage Dispatch Table
+# -----------------------------------------------------------------------------
+# item type -> (pending dir, approved dir, content extension). Built once at
+# import so handlers share one code path instead of per-type if/elif ladders.
+STAGE_DIRS = {
+    'raw': (Config.PENDING_RAW_DIR, Config.APPROVED_RAW_DIR, '.txt'),
+    'cleaned': (Config.PENDING_CLEANED_DIR, Config.APPROVED_CLEANED_DIR, '.txt'),
+    'chunk': (Config.PENDING_CHUNKED_DIR, Config.APPROVED_CHUNKED_DIR, '.json'),
+}
+
+
+# Paths below are built by plain concatenation onto a directory prefix:
+# the names are already validated single components, so os.path.join's
+# per-argument absolute-path checks buy nothing on these hot paths.
+def _item_paths(base_dir, filename, ext):
+    """Content and metadata paths of a raw/cleaned item inside ``base_dir``."""
+    prefix = base_dir + os.sep
+    return prefix + filename + ext, prefix + _META_FMT(filename)
+
+
+def _chunk_path(base_dir, filename, chunk_index):
+    """Path of one chunk file of ``filename`` inside ``base_dir``."""
+    return base_dir + os.sep + filename + os.sep + _CHUNK_FMT(chunk_index)
+
+
+# -----------------------------------------------------------------------------
+# Helper: Request Argument Validation
+# -----------------------------------------------------------------------------
+# Same charset the submit endpoints accept (letters, digits, '_', '-') plus
+# inner dots; no path separators and no leading dot, so '..' can't escape.
+# No length limit: submit has none either, and anything it accepted must
+# stay approvable/deletable here.
+_SAFE_NAME = re.compile(r'[\w\-][\w\-.]*').fullmatch
+
+INVALID_ARGS_ERROR = 'Invalid filename or chunk_index'
+
+
+def _parse_item_args(args):
+    """
+    Validate ``filename`` and the optional ``chunk_index`` of a request.
+
+    Returns (filename, chunk_index) with chunk_index as an int or None.
+    Raises ValueError/TypeError for an unsafe name or non-integer index.
+    """
+    filename = args['filename']
+    if not isinstance(filename, str) or not _SAFE_NAME(filename):
+        raise ValueError(f'Invalid filename: {filename!r}')
+    chunk_index = args.get('chunk_index')
+    if chunk_index is not None:
+        chunk_index = int(chunk_index)
+    return filename, chunk_index
+
+
+# -----------------------------------------------------------------------------
+# Shared I/O Thread Pool
+# -----------------------------------------------------------------------------
+# Listing endpoints read many small JSON files. The reads are independent and
+# disk-bound, so a small pool (created once, reused across requests) hides the
+# per-file open/read latency.
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix='admin-io',
+)
+
+
+# -----------------------------------------------------------------------------
+# Helper: Timestamps
+# -----------------------------------------------------------------------------
+def _now_iso():
+    """Current UTC time as an ISO-8601 string, e.g. 2024-01-31T12:00:00Z."""
+    return datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+
+# -----------------------------------------------------------------------------
+# Helper: JSON File Loading
+# -----------------------------------------------------------------------------
+def _load_json(path):
+    """Read and parse a single JSON file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _atomic_write_json(path, obj, fsync=False, indent=True):
+    """
+    Write JSON to ``path`` via a temp file + os.replace.
+
+    The payload is encoded up front and written with a single os.write, so a
+    crash mid-write never leaves a truncated file behind. Each call gets its
+    own temp file, so concurrent writers to the same path never share one.
+    Pass indent=False for files only the platform itself reads back
+    (smaller, faster encode).
+    """
+    data = memoryview((_json_dumps if indent else _json_dumps_compact)(obj))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp'
+    )
+    try:
+        try:
+            os.fchmod(fd, 0o644)   # mkstemp creates 0600
+            while data:
+                data = data[os.write(fd, data):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _fast_move(src, dst):
+    """
+    Move a file, keeping any cross-filesystem copy inside the kernel.
+
+    A rename when src and dst share a filesystem. Otherwise the data is
+    copied with os.copy_file_range (Linux), falling back to shutil.copyfile,
+    which uses sendfile. Unlike shutil.move, no bytes pass through Python.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range, or the kernel refuses it across these filesystems
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+
+def _fsync_dir(path):
+    """Flush a directory's entries (renames/unlinks) to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Bounded by ADMIN_JSON_CACHE_SIZE: listings walk every file in order, so
+# past that many JSON files this LRU thrashes and stops saving any parses.
+@lru_cache(maxsize=max(1, Config.ADMIN_JSON_CACHE_SIZE))
+def _parse_json_version(path, mtime_ns, size):
+    """Parse one (mtime, size) version of a JSON file; see _load_json_cached."""
+    return _load_json(path)
+
+
+def _load_json_cached(path):
+    """
+    Read-only JSON load for listings, reusing the parsed result while the
+    file's mtime and size are unchanged.
+
+    The filesystem stays the source of truth: every call stats the file, so
+    edits made by other blueprints or worker processes are always picked up.
+    The returned dict is shared between requests - callers must not mutate it.
+    """
+    st = os.stat(path)
+    # Same racy-timestamp guard as _scan_dir
+    if time.time_ns() - st.st_mtime_ns < 1_000_000_000:
+        return _load_json(path)
+    return _parse_json_version(path, st.st_mtime_ns, st.st_size)
+
+
+# -----------------------------------------------------------------------------
+# Helper: Chunk Folders
+# -----------------------------------------------------------------------------
+# Approval info shared by every chunk of a folder approved in one go (see
+# approve_all). Names starting with '_' inside a chunk folder are never chunks.
+FOLDER_META_NAME = '_folder.meta.json'
+
+
+def _is_chunk_file(name):
+    """True for chunk_NN.json entries, false for '_'-prefixed sidecars."""
+    return name.endswith('.json') and not name.startswith('_')
+
+
+def _load_folder_meta(folder_path):
+    """Return a chunk folder's _folder.meta.json ({} if it has none)."""
+    try:
+        return _load_json(os.path.join(folder_path, FOLDER_META_NAME))
+    except FileNotFoundError:
+        return {}
+
+
+def _apply_folder_meta(chunk, folder_meta):
+    """Fill in folder-level approval info unless the chunk carries its own."""
+    if folder_meta and 'approved_at' not in chunk:
+        chunk.update(folder_meta)
+    return chunk
+
+
+def _chunk_sort_key(name):
+    """
+    Order chunk_NN.json names by index without parsing them.
+
+    Indices are only zero-padded to two digits (chunk_100.json would sort
+    before chunk_11.json lexically), so compare by length first.
+    """
+    return (len(name), name)
+
+
+def _load_chunk_folder(folder_path):
+    """Load every chunk JSON in a folder, in chunk_index order."""
+    names = sorted(_chunk_files(folder_path), key=_chunk_sort_key)
+    prefix = folder_path + os.sep
+    return [_load_json_cached(prefix + name) for name in names]
+
+
+# -----------------------------------------------------------------------------
+# Helper: Cached Directory Listings
+# -----------------------------------------------------------------------------
+# Bounded by ADMIN_DIR_CACHE_SIZE: the chunk listings scan every chunk
+# folder on each poll, so with more folders than that the LRU thrashes and
+# every listing pays a fresh scandir plus the cache bookkeeping.
+@lru_cache(maxsize=max(1, Config.ADMIN_DIR_CACHE_SIZE))
+def _scan_dir_cached(path, mtime_ns):
+    """
+    List a directory as (name, is_dir, is_file) triples.
+
+    Keyed by the directory's st_mtime_ns, which changes whenever an entry is
+    added, removed or renamed, so an unchanged directory is never re-scanned.
+    """
+    with os.scandir(path) as it:
+        return tuple(
+            (e.name, e.is_dir(follow_symlinks=False), e.is_file(follow_symlinks=False))
+            for e in it
+        )
+
+
+def _scan_dir(path):
+    """Return the (cached) listing of ``path``; empty if it does not exist."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        # A directory modified within the last second can change again without
+        # its mtime moving (coarse timestamp granularity) - don't cache it yet.
+        if time.time_ns() - mtime_ns < 1_000_000_000:
+            return _scan_dir_cached.__wrapped__(path, mtime_ns)
+        return _scan_dir_cached(path, mtime_ns)
+    except FileNotFoundError:
+        return ()
+
+
+def _subfolders(root):
+    """
+    Names of the directories directly inside ``root``, minus hidden ones
+    (folders awaiting background deletion are renamed to '.<name>...').
+
+    Uses the d_type cached by scandir (is_dir(follow_symlinks=False)), so no
+    per-entry stat - unlike os.listdir + os.path.isdir.
+    """
+    return [name for name, is_dir, _ in _scan_dir(root)
+            if is_dir and not name.startswith('.')]
+
+
+def _scan_txt(dir_path):
+    """Base names (without .txt) of the regular .txt files in ``dir_path``."""
+    return [name[:-4] for name, _, is_file in _scan_dir(dir_path)
+            if is_file and name.endswith('.txt')]
+
+
+def _chunk_files(folder_path):
+    """Names of the chunk_NN.json files in one chunk folder."""
+    return [name for name, _, _ in _scan_dir(folder_path) if _is_chunk_file(name)]
+
+
+# -----------------------------------------------------------------------------
+# Helper: File Counting
+# -----------------------------------------------------------------------------
+def _count_ext(dir_path, ext):
+    """Count entries in ``dir_path`` ending with ``ext`` (0 if missing)."""
+    return sum(1 for name, _, _ in _scan_dir(dir_path) if name.endswith(ext))
+
+
+def _count_chunks(root):
+    """Count chunk JSON files across every folder under ``root``."""
+    prefix = root + os.sep
+    # One pool task per folder: on network filesystems the per-folder
+    # stat/getdents round trips dominate, and they overlap freely.
+    return sum(_IO_POOL.map(lambda name: len(_chunk_files(prefix + name)), _subfolders(root)))
+
+
+def _read_pushed_flag(path):
+    """True if the JSON file at ``path`` has a pushed_to_hf marker."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        # Missing or unreadable metadata counts as not pushed
+        return False
+    # Most files were never pushed: a substring scan settles those without
+    # parsing. (The key is appended last, so the whole buffer is searched.)
+    if b'"pushed_to_hf"' not in data:
+        return False
+    try:
+        return bool(_json_loads(data).get('pushed_to_hf'))
+    except ValueError:
+        return False
+
+
+# -----------------------------------------------------------------------------
+# Helper: Push Markers
+# -----------------------------------------------------------------------------
+# A successful push drops '<meta or chunk json>.pushed' (holding the push
+# timestamp) next to the pushed file, so "already pushed?" is a single stat
+# instead of an open + parse. Approving a new version of a file clears it.
+PUSHED_SUFFIX = '.pushed'
+
+
+def _is_pushed(json_path):
+    """True if the item whose metadata/chunk JSON is ``json_path`` was pushed."""
+    if os.path.exists(json_path + PUSHED_SUFFIX):
+        return True
+    # Items pushed before markers existed only carry the JSON flag
+    return _read_pushed_flag(json_path)
+
+
+def _mark_pushed(json_path, pushed_at):
+    """Record a successful push of ``json_path``."""
+    with open(json_path + PUSHED_SUFFIX, 'w', encoding='utf-8') as f:
+        f.write(pushed_at)
+
+
+def _clear_pushed(json_path):
+    """Drop the push marker of ``json_path`` (a new version was approved)."""
+    try:
+        os.remove(json_path + PUSHED_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+
+# Each approved chunk folder also keeps '_index.json' mapping chunk file name
+# -> pushed_at, so listings learn a folder's push state from one open instead
+# of one stat per chunk. It is read-modify-written under the folder's
+# _chunk_lock. Folders pushed before the index existed have none; callers then
+# fall back to the per-chunk markers.
+PUSH_INDEX_NAME = '_index.json'
+
+
+def _load_push_index(folder_path):
+    """The push index of a chunk folder, or None if it has none (or it's unreadable)."""
+    try:
+        return _load_json(folder_path + os.sep + PUSH_INDEX_NAME)
+    except (OSError, ValueError):
+        return None
+
+
+def _update_push_index(folder_path, pushed=None, unpushed=()):
+    """
+    Merge ``pushed`` ({chunk file: pushed_at}) into the folder's push index
+    and drop the ``unpushed`` names. The caller must hold _chunk_lock.
+    """
+    index = _load_push_index(folder_path)
+    if index is None:
+        if not pushed:
+            return
+        index = {}
+    changed = False
+    for name in unpushed:
+        if index.pop(name, None) is not None:
+            changed = True
+    if pushed:
+        index.update(pushed)
+        changed = True
+    if changed:
+        _atomic_write_json(folder_path + os.sep + PUSH_INDEX_NAME, index, indent=False)
+
+
+# -----------------------------------------------------------------------------
+# Helper: Conditional GET (ETag)
+# -----------------------------------------------------------------------------
+def _listing_etag(flat_dirs, chunk_roots, variant=''):
+    """
+    ETag for a response derived purely from directory listings.
+
+    Hashes the st_mtime_ns of ``flat_dirs``, of each chunk root and of every
+    chunk folder directly below it (adding a chunk only touches its folder).
+    All writers create, rename or delete files, so any change moves one of
+    these mtimes. Returns None - don't cache - if a directory changed within
+    the last second, since coarse timestamps may not move again.
+    """
+    dirs = list(flat_dirs)
+    for root in chunk_roots:
+        dirs.append(root)
+        prefix = root + os.sep
+        dirs.extend(prefix + name for name in _subfolders(root))
+    
+    h = hashlib.blake2b(variant.encode(), digest_size=8)
+    now = time.time_ns()
+    for d in dirs:
+        try:
+            mtime_ns = os.stat(d).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = 0
+        if now - mtime_ns < 1_000_000_000:
+            return None
+        h.update(os.fsencode(d) + b'=%d;' % mtime_ns)
+    return h.hexdigest()
+
+
+def _not_modified(etag):
+    """Return a 304 response if the client already holds ``etag``, else None."""
+    if etag and request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def _with_etag(response, etag):
+    """Attach ``etag`` (if any) and make clients revalidate on every poll."""
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Helper: Stats Cache
+# -----------------------------------------------------------------------------
+# The dashboard polls /stats, which walks every chunk folder. Each worker
+# process reuses its last result for _STATS_TTL seconds; admin endpoints that
+# change counts reset it, submissions from other blueprints appear once the
+# TTL lapses. 'val' holds a (stats, etag) pair so both are swapped together.
+_STATS_TTL = 30
+_STATS_CACHE = {'ts': 0.0, 'val': None}
+
+
+def _invalidate_stats():
+    """Force the next /stats call to recount."""
+    _STATS_CACHE['ts'] = 0.0
+
+
+# -----------------------------------------------------------------------------
+# Helper: Streamed Pending Listing
+# -----------------------------------------------------------------------------
+def _generate_pending_jsonl():
+    """
+    Yield one NDJSON line per pending item as it is read from disk.
+
+    Lines look like {"stage": "raw", "item": {...}} or, for chunks,
+    {"stage": "chunked", "folder": "grade_10_science", "item": {...}}.
+    """
+    for stage, stage_dir in (('raw', Config.PENDING_RAW_DIR),
+                             ('cleaned', Config.PENDING_CLEANED_DIR)):
+        prefix = stage_dir + os.sep
+        for name, _, _ in _scan_dir(stage_dir):
+            if name.endswith('.meta.json'):
+                item = _load_json_cached(prefix + name)
+                yield _json_dumps_compact({'stage': stage, 'item': item}) + b'\n'
+    
+    chunked_prefix = Config.PENDING_CHUNKED_DIR + os.sep
+    for folder_name in _subfolders(Config.PENDING_CHUNKED_DIR):
+        for chunk in _load_chunk_folder(chunked_prefix + folder_name):
+            yield _json_dumps_compact({'stage': 'chunked', 'folder': folder_name, 'item': chunk}) + b'\n'
+
+
+# -----------------------------------------------------------------------------
+# Helper: HuggingFace Service Cache
+# -----------------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _hf_service(token):
+    """
+    One HuggingFaceService per token, reused across push requests so the
+    HfApi client (and its pooled HTTP connections) outlives a single push.
+    """
+    return HuggingFaceService(token=token)
+
+
+# -----------------------------------------------------------------------------
+# Helper: Pushing a Text Stage (raw / cleaned)
+# -----------------------------------------------------------------------------
+# Uploads are network-bound HTTPS round-trips, so they get their own bounded
+# pool: a long push never starves the listing reads queued on _IO_POOL, and
+# the bound keeps concurrent commits under the Hub's rate limits.
+_UPLOAD_POOL = ThreadPoolExecutor(
+    max_workers=max(1, Config.HF_UPLOAD_WORKERS),
+    thread_name_prefix='admin-upload',
+)
+
+
+def _push_one(prefix, base_name, upload_fn, repo, pushed_at):
+    """
+    Read, upload and mark one raw/cleaned item. Runs on _UPLOAD_POOL.
+
+    Returns (status, error) with status 'uploaded', 'skipped' or 'failed'.
+    Nothing is logged here: pool threads have no app context.
+    """
+    meta_path = prefix + _META_FMT(base_name)
+    try:
+        try:
+            metadata = _load_json(meta_path)
+        except FileNotFoundError:
+            metadata = {}
+
+        if metadata.get('pushed_to_hf'):
+            return 'skipped', None
+
+        # The .txt is handed over as a path and streamed by huggingface_hub
+        result = upload_fn(base_name, prefix + _TXT_FMT(base_name), metadata, repo)
+        if not result['success']:
+            return 'failed', result.get('error')
+
+        # Mark as pushed
+        metadata['pushed_to_hf'] = pushed_at
+        _atomic_write_json(meta_path, metadata, indent=False)
+        _mark_pushed(meta_path, pushed_at)
+        return 'uploaded', None
+    except Exception as e:
+        return 'failed', e
+
+
+def _push_stage(src_dir, upload_fn, bucket, target_filename, repo, label):
+    """
+    Upload every un-pushed .txt item in src_dir with upload_fn.
+
+    upload_fn is one of the HuggingFaceService upload_*_file_from_path
+    methods and bucket is the matching results dict, updated in place.
+    Uploads overlap on _UPLOAD_POOL; results are tallied here, in the
+    request thread.
+    """
+    logger = current_app.logger
+    prefix = src_dir + os.sep
+    to_push = []
+    for base_name in _scan_txt(src_dir):
+        # ── Per-file filter ───────────────────────────────────────
+        if target_filename and base_name != target_filename:
+            continue
+
+        # Skip already-pushed (marker present: no need to read anything)
+        if os.path.exists(prefix + _META_FMT(base_name) + PUSHED_SUFFIX):
+            bucket['skipped'] += 1
+            continue
+        to_push.append(base_name)
+
+    pushed_at = _now_iso()   # one timestamp for the whole stage
+    outcomes = _UPLOAD_POOL.map(
+        lambda base_name: _push_one(prefix, base_name, upload_fn, repo, pushed_at), to_push
+    )
+    for base_name, (status, error) in zip(to_push, outcomes):
+        bucket[status] += 1
+        if status == 'uploaded':
+            bucket['files'].append(base_name)
+        elif status == 'failed':
+            logger.error('%s upload failed for %s: %s', label, base_name, error)
+
 
 # -----------------------------------------------------------------------------
 # GET /api/admin/pending - Get All Pending Items
@@ -46,48 +658,62 @@ def get_all_pending():
     
     This gives admin a consolidated view of everything that needs review.
     
+    Query params:
+        format: (optional) "jsonl" streams one NDJSON line per pending item
+                instead of building the whole object in memory
+    
     Returns:
         JSON: Object with pending counts and items for each stage
     """
     try:
-        from ..config import Config
+        # Unchanged directories -> 304 without reading a single file
+        response_format = request.args.get('format', '')
+        etag = _listing_etag(
+            (Config.PENDING_RAW_DIR, Config.PENDING_CLEANED_DIR),
+            (Config.PENDING_CHUNKED_DIR,),
+            variant=response_format,
+        )
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
         
-        pending = {
-            'raw': [],
-            'cleaned': [],
-            'chunked': {}
-        }
+        if response_format == 'jsonl':
+            return _with_etag(Response(
+                stream_with_context(_generate_pending_jsonl()),
+                mimetype='application/x-ndjson',
+            ), etag)
         
-        # Get pending raw files
-        if os.path.exists(Config.PENDING_RAW_DIR):
-            for filename in os.listdir(Config.PENDING_RAW_DIR):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(Config.PENDING_RAW_DIR, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pending['raw'].append(json.load(f))
+        # Listings come from the mtime-keyed cache; the JSON reads are fanned
+        # out over the I/O pool. Every stage is submitted before any result is
+        # collected, so raw, cleaned and chunk reads all overlap (the pool size
+        # bounds how many run at once).
+        meta_paths = {
+            stage: [prefix + name
+                    for name, _, _ in _scan_dir(stage_dir) if name.endswith('.meta.json')]
+            for stage, stage_dir, prefix in (
+                ('raw', Config.PENDING_RAW_DIR, Config.PENDING_RAW_DIR + os.sep),
+                ('cleaned', Config.PENDING_CLEANED_DIR, Config.PENDING_CLEANED_DIR + os.sep),
+            )
+        }
+        raw_meta = _IO_POOL.map(_load_json_cached, meta_paths['raw'])
+        cleaned_meta = _IO_POOL.map(_load_json_cached, meta_paths['cleaned'])
         
-        # Get pending cleaned files
-        if os.path.exists(Config.PENDING_CLEANED_DIR):
-            for filename in os.listdir(Config.PENDING_CLEANED_DIR):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(Config.PENDING_CLEANED_DIR, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pending['cleaned'].append(json.load(f))
+        # Pending chunks: one pool task per folder
+        folders = _subfolders(Config.PENDING_CHUNKED_DIR)
+        chunked_prefix = Config.PENDING_CHUNKED_DIR + os.sep
+        folder_chunks = _IO_POOL.map(
+            _load_chunk_folder,
+            [chunked_prefix + name for name in folders],
+        )
         
-        # Get pending chunks
-        if os.path.exists(Config.PENDING_CHUNKED_DIR):
-            for folder_name in os.listdir(Config.PENDING_CHUNKED_DIR):
-                folder_path = os.path.join(Config.PENDING_CHUNKED_DIR, folder_name)
-                if os.path.isdir(folder_path):
-                    chunks = []
-                    for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
-                            chunk_path = os.path.join(folder_path, chunk_file)
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunks.append(json.load(f))
-                    if chunks:
-                        chunks.sort(key=lambda x: x.get('chunk_index', 0))
-                        pending['chunked'][folder_name] = chunks
+        pending = {
+            'raw': list(raw_meta),
+            'cleaned': list(cleaned_meta),
+            'chunked': {
+                folder_name: chunks
+                for folder_name, chunks in zip(folders, folder_chunks) if chunks
+            }
+        }
         
         # Calculate totals
         totals = {
@@ -98,14 +724,14 @@ def get_all_pending():
                      sum(len(c) for c in pending['chunked'].values())
         }
         
-        return jsonify({
+        return _with_etag(jsonify({
             'success': True,
             'pending': pending,
             'totals': totals
-        })
+        }), etag)
         
-    except Exception as e:
-        current_app.logger.error(f'Error getting pending items: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error getting pending items')
         return jsonify({
             'success': False,
             'error': 'Failed to get pending items'
@@ -129,85 +755,67 @@ def get_pending_item():
         JSON: Item content and metadata
     """
     try:
-        from ..config import Config
-        
         item_type = request.args.get('type')
-        filename = request.args.get('filename')
         
-        if not item_type or not filename:
+        if not item_type or not request.args.get('filename'):
             return jsonify({
                 'success': False,
                 'error': 'Missing type or filename'
             }), 400
         
+        try:
+            filename, chunk_index = _parse_item_args(request.args)
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': INVALID_ARGS_ERROR
+            }), 400
+        
+        if item_type not in STAGE_DIRS:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid type'
+            }), 400
+        pending_dir, _, ext = STAGE_DIRS[item_type]
+        
         result = {
             'success': True,
             'type': item_type,
             'filename': filename
         }
         
-        if item_type == 'raw':
-            content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            with open(content_path, 'r', encoding='utf-8') as f:
-                result['content'] = f.read()
-            
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                result['metadata'] = json.load(f)
-                
-        elif item_type == 'cleaned':
-            content_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            with open(content_path, 'r', encoding='utf-8') as f:
-                result['content'] = f.read()
-            
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                result['metadata'] = json.load(f)
-                
-        elif item_type == 'chunk':
-            chunk_index = request.args.get('chunk_index')
+        if item_type == 'chunk':
             if chunk_index is None:
                 return jsonify({
                     'success': False,
                     'error': 'Missing chunk_index'
                 }), 400
             
-            chunk_file = f'chunk_{int(chunk_index):02d}.json'
-            chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if not os.path.exists(chunk_path):
+            try:
+                result['chunk'] = _load_json(_chunk_path(pending_dir, filename, chunk_index))
+            except FileNotFoundError:
                 return jsonify({
                     'success': False,
                     'error': 'Chunk not found'
                 }), 404
-            
-            with open(chunk_path, 'r', encoding='utf-8') as f:
-                chunk_data = json.load(f)
-                result['chunk'] = chunk_data
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid type'
-            }), 400
+            content_path, meta_path = _item_paths(pending_dir, filename, ext)
+            
+            try:
+                with open(content_path, 'r', encoding='utf-8') as f:
+                    result['content'] = f.read()
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Item not found'
+                }), 404
+            
+            result['metadata'] = _load_json(meta_path)
         
         return jsonify(result)
         
-    except Exception as e:
-        current_app.logger.error(f'Error getting pending item: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error getting pending item')
         return jsonify({
             'success': False,
             'error': 'Failed to get item'
@@ -245,98 +853,74 @@ def update_pending_item():
             }), 400
         
         item_type = data['type']
-        filename = data['filename']
+        try:
+            filename, chunk_index = _parse_item_args(data)
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': INVALID_ARGS_ERROR
+            }), 400
         
-        from ..config import Config
+        if item_type not in STAGE_DIRS:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid type'
+            }), 400
+        pending_dir, _, ext = STAGE_DIRS[item_type]
         
-        if item_type == 'raw':
-            content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
+        if item_type == 'chunk':
+            if chunk_index is None:
                 return jsonify({
                     'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            # Update content if provided
-            if 'content' in data:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    f.write(data['content'])
-            
-            # Update metadata
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            if 'metadata' in data:
-                # Merge metadata updates
-                metadata.update(data['metadata'])
+                    'error': 'Missing chunk_index'
+                }), 400
             
-            # Track edit history
-            metadata['updated_at'] = datetime.now().isoformat()
-            metadata['updated_by'] = 'admin'
+            chunk_path = _chunk_path(pending_dir, filename, chunk_index)
             
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # Update chunk (only an existing one - the atomic write would create it)
+            try:
+                os.stat(chunk_path)
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Chunk not found'
+                }), 404
+            if 'chunk' in data:
+                chunk_data = data['chunk']
+                chunk_data['updated_at'] = _now_iso()
+                chunk_data['updated_by'] = 'admin'
                 
-        elif item_type == 'cleaned':
-            content_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
+                _atomic_write_json(chunk_path, chunk_data)
+        else:
+            content_path, meta_path = _item_paths(pending_dir, filename, ext)
             
-            if not os.path.exists(content_path):
+            # Update content if provided
+            # ('r+' fails on a missing item instead of creating a stray file)
+            try:
+                with open(content_path, 'r+', encoding='utf-8') as f:
+                    if 'content' in data:
+                        f.write(data['content'])
+                        f.truncate()
+            except FileNotFoundError:
                 return jsonify({
                     'success': False,
                     'error': 'Item not found'
                 }), 404
             
-            # Update content if provided
-            if 'content' in data:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    f.write(data['content'])
-            
             # Update metadata
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = _load_json(meta_path)
             
             if 'metadata' in data:
+                # Merge metadata updates
                 metadata.update(data['metadata'])
             
-            metadata['updated_at'] = datetime.now().isoformat()
+            # Track edit history
+            metadata['updated_at'] = _now_iso()
             metadata['updated_by'] = 'admin'
             
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                
-        elif item_type == 'chunk':
-            chunk_index = data.get('chunk_index')
-            if chunk_index is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing chunk_index'
-                }), 400
-            
-            chunk_file = f'chunk_{int(chunk_index):02d}.json'
-            chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if not os.path.exists(chunk_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Chunk not found'
-                }), 404
-            
-            # Update chunk
-            if 'chunk' in data:
-                chunk_data = data['chunk']
-                chunk_data['updated_at'] = datetime.now().isoformat()
-                chunk_data['updated_by'] = 'admin'
-                
-                with open(chunk_path, 'w', encoding='utf-8') as f:
-                    json.dump(chunk_data, f, indent=2, ensure_ascii=False)
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid type'
-            }), 400
+            _atomic_write_json(meta_path, metadata)
+        
+        _scan_dir_cached.cache_clear()
         
         return jsonify({
             'success': True,
@@ -345,8 +929,8 @@ def update_pending_item():
             'filename': filename
         })
         
-    except Exception as e:
-        current_app.logger.error(f'Error updating item: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error updating item')
         return jsonify({
             'success': False,
             'error': 'Failed to update item'
@@ -383,110 +967,87 @@ def approve_submission():
             }), 400
         
         submission_type = data['type']
-        filename = data['filename']
+        try:
+            filename, chunk_index = _parse_item_args(data)
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': INVALID_ARGS_ERROR
+            }), 400
         
-        from ..config import Config
+        if submission_type not in STAGE_DIRS:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid type. Must be raw, cleaned, or chunk'
+            }), 400
+        pending_dir, approved_dir, ext = STAGE_DIRS[submission_type]
         
-        if submission_type == 'raw':
-            # Move raw file from pending to approved
-            pending_content = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            approved_content = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
-            approved_meta = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(pending_content):
-                return jsonify({
-                    'success': False,
-                    'error': 'Pending file not found'
-                }), 404
-            
-            # Update metadata with approval info
-            with open(pending_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            metadata['status'] = 'approved'
-            metadata['approved_at'] = datetime.now().isoformat()
-            metadata['approved_by'] = 'admin'
-            
-            # Move files
-            shutil.move(pending_content, approved_content)
-            with open(approved_meta, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            os.remove(pending_meta)
-            
-        elif submission_type == 'cleaned':
-            # Move cleaned file from pending to approved
-            pending_content = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            approved_content = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
-            approved_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(pending_content):
-                return jsonify({
-                    'success': False,
-                    'error': 'Pending file not found'
-                }), 404
-            
-            # Update metadata
-            with open(pending_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            metadata['status'] = 'approved'
-            metadata['approved_at'] = datetime.now().isoformat()
-            metadata['approved_by'] = 'admin'
-            
-            # Move files
-            shutil.move(pending_content, approved_content)
-            with open(approved_meta, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            os.remove(pending_meta)
-            
-        elif submission_type == 'chunk':
+        if submission_type == 'chunk':
             # Move chunk from pending to approved
-            chunk_index = data.get('chunk_index')
             if chunk_index is None:
                 return jsonify({
                     'success': False,
                     'error': 'Missing chunk_index'
                 }), 400
             
-            chunk_file = f'chunk_{chunk_index:02d}.json'
-            pending_chunk = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
+            pending_chunk = _chunk_path(pending_dir, filename, chunk_index)
             
-            if not os.path.exists(pending_chunk):
+            # Update chunk with approval info
+            try:
+                chunk = _load_json(pending_chunk)
+            except FileNotFoundError:
                 return jsonify({
                     'success': False,
                     'error': 'Pending chunk not found'
                 }), 404
             
             # Create approved directory if needed
-            approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-            os.makedirs(approved_dir, exist_ok=True)
-            
-            # Update chunk with approval info
-            with open(pending_chunk, 'r', encoding='utf-8') as f:
-                chunk = json.load(f)
+            approved_chunk = _chunk_path(approved_dir, filename, chunk_index)
+            os.makedirs(os.path.dirname(approved_chunk), exist_ok=True)
             
             chunk['status'] = 'approved'
-            chunk['approved_at'] = datetime.now().isoformat()
+            chunk['approved_at'] = _now_iso()
             chunk['approved_by'] = 'admin'
             
-            approved_chunk = os.path.join(approved_dir, chunk_file)
-            with open(approved_chunk, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, indent=2, ensure_ascii=False)
+            # Forget any push of the version being replaced, index first
+            with _chunk_lock(filename):
+                _update_push_index(os.path.dirname(approved_chunk), unpushed=(_CHUNK_FMT(chunk_index),))
+            _atomic_write_json(approved_chunk, chunk)
+            _clear_pushed(approved_chunk)
             
             os.remove(pending_chunk)
             
-            # Clean up empty directory
-            pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-            if os.path.exists(pending_dir) and not os.listdir(pending_dir):
-                os.rmdir(pending_dir)
-        
+            # Clean up empty directory (rmdir refuses non-empty ones)
+            try:
+                os.rmdir(os.path.dirname(pending_chunk))
+            except OSError:
+                pass
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid type. Must be raw, cleaned, or chunk'
-            }), 400
+            # Move raw/cleaned file from pending to approved
+            pending_content, pending_meta = _item_paths(pending_dir, filename, ext)
+            approved_content, approved_meta = _item_paths(approved_dir, filename, ext)
+            
+            try:
+                # Update metadata with approval info
+                metadata = _load_json(pending_meta)
+                
+                metadata['status'] = 'approved'
+                metadata['approved_at'] = _now_iso()
+                metadata['approved_by'] = 'admin'
+                
+                # Move files
+                _fast_move(pending_content, approved_content)
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Pending file not found'
+                }), 404
+            _atomic_write_json(approved_meta, metadata)
+            _clear_pushed(approved_meta)
+            os.remove(pending_meta)
+        
+        _scan_dir_cached.cache_clear()
+        _invalidate_stats()
         
         return jsonify({
             'success': True,
@@ -495,8 +1056,8 @@ def approve_submission():
             'filename': filename
         })
         
-    except Exception as e:
-        current_app.logger.error(f'Error approving submission: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error approving submission')
         return jsonify({
             'success': False,
             'error': 'Failed to approve submission'
@@ -534,56 +1095,50 @@ def reject_submission():
             }), 400
         
         submission_type = data['type']
-        filename = data['filename']
+        try:
+            filename, chunk_index = _parse_item_args(data)
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': INVALID_ARGS_ERROR
+            }), 400
         reason = data.get('reason', 'No reason provided')
         
-        from ..config import Config
+        if submission_type not in STAGE_DIRS:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid type'
+            }), 400
+        pending_dir, _, ext = STAGE_DIRS[submission_type]
         
-        if submission_type == 'raw':
-            pending_content = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if os.path.exists(pending_content):
-                os.remove(pending_content)
-            if os.path.exists(pending_meta):
-                os.remove(pending_meta)
-                
-        elif submission_type == 'cleaned':
-            pending_content = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if os.path.exists(pending_content):
-                os.remove(pending_content)
-            if os.path.exists(pending_meta):
-                os.remove(pending_meta)
-                
-        elif submission_type == 'chunk':
-            chunk_index = data.get('chunk_index')
+        if submission_type == 'chunk':
             if chunk_index is None:
                 return jsonify({
                     'success': False,
                     'error': 'Missing chunk_index'
                 }), 400
-            
-            chunk_file = f'chunk_{chunk_index:02d}.json'
-            pending_chunk = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if os.path.exists(pending_chunk):
-                os.remove(pending_chunk)
-            
-            # Clean up empty directory
-            pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-            if os.path.exists(pending_dir) and not os.listdir(pending_dir):
-                os.rmdir(pending_dir)
-        
+            paths = (_chunk_path(pending_dir, filename, chunk_index),)
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid type'
-            }), 400
+            paths = _item_paths(pending_dir, filename, ext)
+        
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        
+        if submission_type == 'chunk':
+            # Clean up empty directory (rmdir refuses non-empty ones)
+            try:
+                os.rmdir(os.path.join(pending_dir, filename))
+            except OSError:
+                pass
+        
+        _scan_dir_cached.cache_clear()
+        _invalidate_stats()
         
         # Log rejection (could be stored in a rejection log file)
-        current_app.logger.info(f'Rejected {submission_type}: {filename}, Reason: {reason}')
+        current_app.logger.info('Rejected %s: %s, Reason: %s', submission_type, filename, reason)
         
         return jsonify({
             'success': True,
@@ -592,8 +1147,8 @@ def reject_submission():
             'filename': filename
         })
         
-    except Exception as e:
-        current_app.logger.error(f'Error rejecting submission: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error rejecting submission')
         return jsonify({
             'success': False,
             'error': 'Failed to reject submission'
@@ -627,54 +1182,36 @@ def approve_all():
                 'error': 'Missing type'
             }), 400
         
-        from ..config import Config
         approved_count = 0
+        approved_at = _now_iso()
         
-        if submission_type == 'raw':
-            if os.path.exists(Config.PENDING_RAW_DIR):
-                for filename in list(os.listdir(Config.PENDING_RAW_DIR)):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        # Approve each file
-                        # (Reusing approve logic)
-                        pending_content = os.path.join(Config.PENDING_RAW_DIR, filename)
-                        pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{base_name}.meta.json')
-                        approved_content = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                        approved_meta = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-                        
-                        if os.path.exists(pending_meta):
-                            with open(pending_meta, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            metadata['status'] = 'approved'
-                            metadata['approved_at'] = datetime.now().isoformat()
-                            
-                            shutil.move(pending_content, approved_content)
-                            with open(approved_meta, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            os.remove(pending_meta)
-                            approved_count += 1
-        
-        elif submission_type == 'cleaned':
-            if os.path.exists(Config.PENDING_CLEANED_DIR):
-                for filename in list(os.listdir(Config.PENDING_CLEANED_DIR)):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        pending_content = os.path.join(Config.PENDING_CLEANED_DIR, filename)
-                        pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{base_name}.meta.json')
-                        approved_content = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                        approved_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-                        
-                        if os.path.exists(pending_meta):
-                            with open(pending_meta, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            metadata['status'] = 'approved'
-                            metadata['approved_at'] = datetime.now().isoformat()
-                            
-                            shutil.move(pending_content, approved_content)
-                            with open(approved_meta, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            os.remove(pending_meta)
-                            approved_count += 1
+        if submission_type in ('raw', 'cleaned'):
+            pending_dir, approved_dir, _ = STAGE_DIRS[submission_type]
+            pending_prefix = pending_dir + os.sep
+            approved_prefix = approved_dir + os.sep
+            
+            def _approve_one(filename):
+                base_name = filename[:-4]
+                pending_meta = pending_prefix + _META_FMT(base_name)
+                try:
+                    metadata = _load_json(pending_meta)
+                except FileNotFoundError:
+                    return False
+                metadata['status'] = 'approved'
+                metadata['approved_at'] = approved_at
+                
+                # A rename on the same filesystem, an in-kernel copy otherwise
+                _fast_move(pending_prefix + filename, approved_prefix + filename)
+                _atomic_write_json(approved_prefix + _META_FMT(base_name), metadata, fsync=True)
+                _clear_pushed(approved_prefix + _META_FMT(base_name))
+                os.remove(pending_meta)
+                return True
+            
+            filenames = [n for n, _, _ in _scan_dir(pending_dir) if n.endswith('.txt')]
+            approved_count = sum(_IO_POOL.map(_approve_one, filenames))
+            if approved_count:
+                # One directory fsync covers every rename above
+                _fsync_dir(approved_dir)
         
         elif submission_type == 'chunks':
             target_file = data.get('filename')
@@ -683,30 +1220,62 @@ def approve_all():
                     'success': False,
                     'error': 'Filename required for chunk approval'
                 }), 400
+            if not isinstance(target_file, str) or not _SAFE_NAME(target_file):
+                return jsonify({
+                    'success': False,
+                    'error': INVALID_ARGS_ERROR
+                }), 400
             
             pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, target_file)
             approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, target_file)
             
-            if os.path.exists(pending_dir):
-                os.makedirs(approved_dir, exist_ok=True)
-                for chunk_file in list(os.listdir(pending_dir)):
-                    if chunk_file.endswith('.json'):
-                        pending_path = os.path.join(pending_dir, chunk_file)
-                        approved_path = os.path.join(approved_dir, chunk_file)
-                        
-                        with open(pending_path, 'r', encoding='utf-8') as f:
-                            chunk = json.load(f)
-                        chunk['status'] = 'approved'
-                        chunk['approved_at'] = datetime.now().isoformat()
+            pending_prefix = pending_dir + os.sep
+            approved_prefix = approved_dir + os.sep
+            
+            def _approve_chunk(chunk_file):
+                pending_path = pending_prefix + chunk_file
+                chunk = _load_json(pending_path)
+                chunk['status'] = 'approved'
+                chunk['approved_at'] = approved_at
+                _atomic_write_json(approved_prefix + chunk_file, chunk, fsync=True)
+                _clear_pushed(approved_prefix + chunk_file)
+                os.remove(pending_path)
+                return True
+            
+            # The chunker's per-file lock keeps new chunks out of pending_dir
+            # while it is being moved.
+            with _chunk_lock(target_file):
+                chunk_files = _chunk_files(pending_dir)
+                if chunk_files:
+                    # Fast path: record the approval once in a folder sidecar
+                    # and move the whole folder with a single rename. That only
+                    # works while nothing has been approved for this file yet.
+                    folder_meta_path = os.path.join(pending_dir, FOLDER_META_NAME)
+                    _atomic_write_json(folder_meta_path, {
+                        'status': 'approved',
+                        'approved_at': approved_at,
+                        'approved_by': 'admin',
+                    }, fsync=True, indent=False)
+                    try:
+                        os.rename(pending_dir, approved_dir)
+                        _fsync_dir(Config.APPROVED_CHUNKED_DIR)
+                        approved_count = len(chunk_files)
+                    except OSError:
+                        # Approved folder already has chunks - move them one by one
+                        os.remove(folder_meta_path)
+                        os.makedirs(approved_dir, exist_ok=True)
+                        _update_push_index(approved_dir, unpushed=chunk_files)
+                        approved_count = sum(_IO_POOL.map(_approve_chunk, chunk_files))
+                        _fsync_dir(approved_dir)
                         
-                        with open(approved_path, 'w', encoding='utf-8') as f:
-                            json.dump(chunk, f, indent=2, ensure_ascii=False)
-                        os.remove(pending_path)
-                        approved_count += 1
-                
-                # Clean up empty directory
-                if not os.listdir(pending_dir):
-                    os.rmdir(pending_dir)
+                        # Clean up empty directory (rmdir refuses non-empty ones)
+                        try:
+                            os.rmdir(pending_dir)
+                        except OSError:
+                            pass
+        
+        _scan_dir_cached.cache_clear()
+        _invalidate_stats()
         
         return jsonify({
             'success': True,
@@ -714,8 +1283,8 @@ def approve_all():
             'approved_count': approved_count
         })
         
-    except Exception as e:
-        current_app.logger.error(f'Error in bulk approve: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error in bulk approve')
         return jsonify({
             'success': False,
             'error': 'Failed to approve items'
@@ -739,38 +1308,44 @@ def get_stats():
         JSON: Statistics object
     """
     try:
-        from ..config import Config
-        
-        stats = {
-            'raw': {'pending': 0, 'approved': 0},
-            'cleaned': {'pending': 0, 'approved': 0},
-            'chunked': {'pending': 0, 'approved': 0}
-        }
-        
-        # Count raw files
-        if os.path.exists(Config.PENDING_RAW_DIR):
-            stats['raw']['pending'] = len([f for f in os.listdir(Config.PENDING_RAW_DIR) if f.endswith('.txt')])
-        if os.path.exists(Config.APPROVED_RAW_DIR):
-            stats['raw']['approved'] = len([f for f in os.listdir(Config.APPROVED_RAW_DIR) if f.endswith('.txt')])
+        cached = _STATS_CACHE['val']
+        if cached is not None and time.monotonic() - _STATS_CACHE['ts'] < _STATS_TTL:
+            stats, etag = cached
+            not_modified = _not_modified(etag)
+            if not_modified is not None:
+                return not_modified
+            return _with_etag(jsonify({
+                'success': True,
+                'stats': stats
+            }), etag)
         
-        # Count cleaned files
-        if os.path.exists(Config.PENDING_CLEANED_DIR):
-            stats['cleaned']['pending'] = len([f for f in os.listdir(Config.PENDING_CLEANED_DIR) if f.endswith('.txt')])
-        if os.path.exists(Config.APPROVED_CLEANED_DIR):
-            stats['cleaned']['approved'] = len([f for f in os.listdir(Config.APPROVED_CLEANED_DIR) if f.endswith('.txt')])
+        etag = _listing_etag(
+            (Config.PENDING_RAW_DIR, Config.APPROVED_RAW_DIR,
+             Config.PENDING_CLEANED_DIR, Config.APPROVED_CLEANED_DIR),
+            (Config.PENDING_CHUNKED_DIR, Config.APPROVED_CHUNKED_DIR),
+        )
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
         
-        # Count chunks
-        if os.path.exists(Config.PENDING_CHUNKED_DIR):
-            for folder in os.listdir(Config.PENDING_CHUNKED_DIR):
-                folder_path = os.path.join(Config.PENDING_CHUNKED_DIR, folder)
-                if os.path.isdir(folder_path):
-                    stats['chunked']['pending'] += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
+        # The four .txt directories are counted on the I/O pool while the two
+        # chunk roots are walked here (they fan out per folder on the pool
+        # themselves, so they must not run inside a pool task).
+        txt_counts = _IO_POOL.map(
+            _count_ext,
+            (Config.PENDING_RAW_DIR, Config.APPROVED_RAW_DIR,
+             Config.PENDING_CLEANED_DIR, Config.APPROVED_CLEANED_DIR),
+            ('.txt',) * 4,
+        )
+        chunks_pending = _count_chunks(Config.PENDING_CHUNKED_DIR)
+        chunks_approved = _count_chunks(Config.APPROVED_CHUNKED_DIR)
+        raw_pending, raw_approved, cleaned_pending, cleaned_approved = txt_counts
         
-        if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-            for folder in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder)
-                if os.path.isdir(folder_path):
-                    stats['chunked']['approved'] += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
+        stats = {
+            'raw': {'pending': raw_pending, 'approved': raw_approved},
+            'cleaned': {'pending': cleaned_pending, 'approved': cleaned_approved},
+            'chunked': {'pending': chunks_pending, 'approved': chunks_approved}
+        }
         
         # Calculate totals
         stats['totals'] = {
@@ -778,18 +1353,54 @@ def get_stats():
             'approved': stats['raw']['approved'] + stats['cleaned']['approved'] + stats['chunked']['approved']
         }
         
-        return jsonify({
+        _STATS_CACHE['val'] = (stats, etag)
+        _STATS_CACHE['ts'] = time.monotonic()
+        
+        return _with_etag(jsonify({
             'success': True,
             'stats': stats
-        })
+        }), etag)
         
-    except Exception as e:
-        current_app.logger.error(f'Error getting stats: {str(e)}')
+    except Exception:
+        current_app.logger.exception('Error getting stats')
         return jsonify({
             'success': False,
             'error': 'Failed to get statistics'
         }), 500
 
+# -----------------------------------------------------------------------------
+# Helper: Approved File Entries
+# -----------------------------------------------------------------------------
+_EMPTY_FILE_ENTRY = {
+    'filename': '', 'raw': False, 'raw_pushed': False, 'cleaned': False,
+    'cleaned_pushed': False, 'chunks': 0, 'chunks_pushed': 0,
+}
+
+
+class _FileEntries(dict):
+    """base_name -> approved-files entry; a missing name gets a blank entry."""
+    __slots__ = ()
+
+    def __missing__(self, base):
+        entry = self[base] = dict(_EMPTY_FILE_ENTRY, filename=base)
+        return entry
+
+
+def _generate_files_json(entries, batch_size=256):
+    """
+    Yield {"success":true,"files":[...],"count":N} piece by piece.
+
+    Entries are encoded one batch at a time, so the whole document is never
+    held in memory and the first bytes go out before the last are encoded.
+    """
+    yield b'{"success":true,"files":['
+    sep = b''
+    for start in range(0, len(entries), batch_size):
+        yield sep + b','.join(map(_json_dumps_compact, entries[start:start + batch_size]))
+        sep = b','
+    yield b'],"count":%d}' % len(entries)
+
+
 # -----------------------------------------------------------------------------
 # GET /api/admin/approved-files - List all approved files with push status
 # -----------------------------------------------------------------------------
@@ -801,71 +1412,60 @@ def list_approved_files():
     per-file Push buttons.
     """
     try:
-        from ..config import Config
-
-        files = {}  # keyed by base_name
+        files = _FileEntries()  # keyed by base_name
+
+        # Every pushed_to_hf flag is read on the I/O pool. All three stages
+        # are submitted before any result is consumed, so the reads overlap.
+        raw_names = _scan_txt(Config.APPROVED_RAW_DIR)
+        raw_prefix = Config.APPROVED_RAW_DIR + os.sep
+        raw_pushed = _IO_POOL.map(_is_pushed, [raw_prefix + _META_FMT(b) for b in raw_names])
+
+        cleaned_names = _scan_txt(Config.APPROVED_CLEANED_DIR)
+        cleaned_prefix = Config.APPROVED_CLEANED_DIR + os.sep
+        cleaned_pushed = _IO_POOL.map(_is_pushed, [cleaned_prefix + _META_FMT(b) for b in cleaned_names])
+
+        chunk_counts = {}   # folder -> [total, pushed]
+        chunk_jobs = []     # (folder, chunk path) for folders without an index
+        chunked_prefix = Config.APPROVED_CHUNKED_DIR + os.sep
+        for folder in _subfolders(Config.APPROVED_CHUNKED_DIR):
+            folder_path = chunked_prefix + folder
+            names = _chunk_files(folder_path)
+            push_index = _load_push_index(folder_path)
+            if push_index is not None:
+                chunk_counts[folder] = [len(names), sum(name in push_index for name in names)]
+                continue
+            chunk_counts[folder] = [len(names), 0]
+            chunk_jobs.extend((folder, folder_path + os.sep + name) for name in names)
+        chunk_pushed = _IO_POOL.map(_is_pushed, [path for _, path in chunk_jobs])
 
         # ── approved raw ──────────────────────────────────────────────────
-        if os.path.exists(Config.APPROVED_RAW_DIR):
-            for fname in os.listdir(Config.APPROVED_RAW_DIR):
-                if not fname.endswith('.txt'):
-                    continue
-                base = fname.replace('.txt', '')
-                meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{base}.meta.json')
-                pushed = False
-                if os.path.exists(meta_path):
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pushed = bool(json.load(f).get('pushed_to_hf'))
-                entry = files.setdefault(base, {'filename': base, 'raw': False, 'cleaned': False, 'chunks': 0, 'chunks_pushed': 0})
-                entry['raw'] = True
-                entry['raw_pushed'] = pushed
+        for base, pushed in zip(raw_names, raw_pushed):
+            entry = files[base]
+            entry['raw'] = True
+            entry['raw_pushed'] = pushed
 
         # ── approved cleaned ──────────────────────────────────────────────
-        if os.path.exists(Config.APPROVED_CLEANED_DIR):
-            for fname in os.listdir(Config.APPROVED_CLEANED_DIR):
-                if not fname.endswith('.txt'):
-                    continue
-                base = fname.replace('.txt', '')
-                meta_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base}.meta.json')
-                pushed = False
-                if os.path.exists(meta_path):
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pushed = bool(json.load(f).get('pushed_to_hf'))
-                entry = files.setdefault(base, {'filename': base, 'raw': False, 'raw_pushed': False, 'cleaned': False, 'chunks': 0, 'chunks_pushed': 0})
-                entry['cleaned'] = True
-                entry['cleaned_pushed'] = pushed
+        for base, pushed in zip(cleaned_names, cleaned_pushed):
+            entry = files[base]
+            entry['cleaned'] = True
+            entry['cleaned_pushed'] = pushed
 
         # ── approved chunks ───────────────────────────────────────────────
-        if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-            for folder in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder)
-                if not os.path.isdir(folder_path):
-                    continue
-                total = 0
-                pushed_count = 0
-                for cf in os.listdir(folder_path):
-                    if not cf.endswith('.json'):
-                        continue
-                    total += 1
-                    chunk_path = os.path.join(folder_path, cf)
-                    try:
-                        with open(chunk_path, 'r', encoding='utf-8') as f:
-                            if json.load(f).get('pushed_to_hf'):
-                                pushed_count += 1
-                    except Exception:
-                        pass
-                entry = files.setdefault(folder, {'filename': folder, 'raw': False, 'raw_pushed': False, 'cleaned': False, 'cleaned_pushed': False})
-                entry['chunks'] = total
-                entry['chunks_pushed'] = pushed_count
-
-        return jsonify({
-            'success': True,
-            'files': sorted(files.values(), key=lambda x: x['filename']),
-            'count': len(files),
-        })
-
-    except Exception as e:
-        current_app.logger.error('Error listing approved files: %s', str(e))
+        for (folder, _), pushed in zip(chunk_jobs, chunk_pushed):
+            if pushed:
+                chunk_counts[folder][1] += 1
+        for folder, (total, pushed_count) in chunk_counts.items():
+            entry = files[folder]
+            entry['chunks'] = total
+            entry['chunks_pushed'] = pushed_count
+
+        return Response(
+            stream_with_context(_generate_files_json(sorted(files.values(), key=itemgetter('filename')))),
+            mimetype='application/json',
+        )
+
+    except Exception:
+        current_app.logger.exception('Error listing approved files')
         return jsonify({'success': False, 'error': 'Failed to list approved files'}), 500
 
 
@@ -898,6 +1498,7 @@ def push_to_huggingface():
                                           // If omitted, all un-pushed files are pushed.
     }
     """
+    logger = current_app.logger
     try:
         data = request.get_json()
 
@@ -915,10 +1516,7 @@ def push_to_huggingface():
         # Optional per-file filter — when set, ONLY this file is pushed.
         target_filename = data.get('filename', '').strip() or None
 
-        from ..services.huggingface import HuggingFaceService
-        from ..config import Config
-
-        hf_service = HuggingFaceService(token=hf_token)
+        hf_service = _hf_service(hf_token)
         if not hf_service.is_configured():
             return jsonify({'success': False, 'error': 'HuggingFace service not configured properly'}), 400
 
@@ -929,130 +1527,63 @@ def push_to_huggingface():
         }
 
         # ------------------------------------------------------------------
-        # Push raw files
+        # Push raw and cleaned files
         # ------------------------------------------------------------------
         if push_type in ['raw', 'all']:
-            repo = data.get('raw_repo') or Config.HF_RAW_REPO
-            if os.path.exists(Config.APPROVED_RAW_DIR):
-                for filename in os.listdir(Config.APPROVED_RAW_DIR):
-                    if not filename.endswith('.txt'):
-                        continue
-                    base_name = filename.replace('.txt', '')
-                    # ── Per-file filter ───────────────────────────────────
-                    if target_filename and base_name != target_filename:
-                        continue
-                    content_path = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-
-                    try:
-                        with open(content_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        metadata = {}
-                        if os.path.exists(meta_path):
-                            with open(meta_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-
-                        # Skip already-pushed
-                        if metadata.get('pushed_to_hf'):
-                            results['raw']['skipped'] += 1
-                            continue
-
-                        result = hf_service.upload_raw_file(base_name, content, metadata, repo)
-                        if result['success']:
-                            results['raw']['uploaded'] += 1
-                            results['raw']['files'].append(base_name)
-                            # Mark as pushed
-                            metadata['pushed_to_hf'] = datetime.utcnow().isoformat() + 'Z'
-                            with open(meta_path, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                        else:
-                            results['raw']['failed'] += 1
-                            current_app.logger.error('Raw upload failed for %s: %s', base_name, result.get('error'))
-                    except Exception as e:
-                        current_app.logger.error('Exception uploading raw %s: %s', base_name, str(e))
-                        results['raw']['failed'] += 1
+            _push_stage(Config.APPROVED_RAW_DIR, hf_service.upload_raw_file_from_path, results['raw'],
+                        target_filename, data.get('raw_repo') or Config.HF_RAW_REPO, 'raw')
 
-        # ------------------------------------------------------------------
-        # Push cleaned files
-        # ------------------------------------------------------------------
         if push_type in ['cleaned', 'all']:
-            repo = data.get('cleaned_repo') or Config.HF_CLEANED_REPO
-            if os.path.exists(Config.APPROVED_CLEANED_DIR):
-                for filename in os.listdir(Config.APPROVED_CLEANED_DIR):
-                    if not filename.endswith('.txt'):
-                        continue
-                    base_name = filename.replace('.txt', '')
-                    # ── Per-file filter ───────────────────────────────────
-                    if target_filename and base_name != target_filename:
-                        continue
-                    content_path = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-
-                    try:
-                        with open(content_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        metadata = {}
-                        if os.path.exists(meta_path):
-                            with open(meta_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-
-                        if metadata.get('pushed_to_hf'):
-                            results['cleaned']['skipped'] += 1
-                            continue
-
-                        result = hf_service.upload_cleaned_file(base_name, content, metadata, repo)
-                        if result['success']:
-                            results['cleaned']['uploaded'] += 1
-                            results['cleaned']['files'].append(base_name)
-                            metadata['pushed_to_hf'] = datetime.utcnow().isoformat() + 'Z'
-                            with open(meta_path, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                        else:
-                            results['cleaned']['failed'] += 1
-                            current_app.logger.error('Cleaned upload failed for %s: %s', base_name, result.get('error'))
-                    except Exception as e:
-                        current_app.logger.error('Exception uploading cleaned %s: %s', base_name, str(e))
-                        results['cleaned']['failed'] += 1
+            _push_stage(Config.APPROVED_CLEANED_DIR, hf_service.upload_cleaned_file_from_path, results['cleaned'],
+                        target_filename, data.get('cleaned_repo') or Config.HF_CLEANED_REPO, 'cleaned')
 
         # ------------------------------------------------------------------
         # Push chunks  — BATCHED per folder (NEW: avoids rate-limiting)
         # ------------------------------------------------------------------
         if push_type in ['chunked', 'all']:
             repo = data.get('chunked_repo') or Config.HF_CHUNKED_REPO
-            if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-                for folder_name in sorted(os.listdir(Config.APPROVED_CHUNKED_DIR)):
-                    folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder_name)
-                    if not os.path.isdir(folder_path):
+            for folder_name in sorted(_subfolders(Config.APPROVED_CHUNKED_DIR)):
+                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder_name)
+                # ── Per-file filter ───────────────────────────────────
+                if target_filename and folder_name != target_filename:
+                    continue
+
+                # Collect only chunks that haven't been pushed yet. The folder's
+                # push index answers for most chunks; marker / JSON-flag hits
+                # from before the index existed are added to it below.
+                unpushed_chunks = []
+                chunk_file_names = {}   # chunk_index -> file name (for marking after push)
+                push_index = _load_push_index(folder_path) or {}
+                index_updates = {}      # chunk file -> pushed_at
+
+                folder_meta = _load_folder_meta(folder_path)
+                for chunk_file in sorted(_chunk_files(folder_path)):
+                    if chunk_file in push_index:
+                        results['chunked']['skipped'] += 1
                         continue
-                    # ── Per-file filter ───────────────────────────────────
-                    if target_filename and folder_name != target_filename:
+                    chunk_path = folder_path + os.sep + chunk_file
+                    try:
+                        with open(chunk_path + PUSHED_SUFFIX, encoding='utf-8') as f:
+                            index_updates[chunk_file] = f.read()
+                        results['chunked']['skipped'] += 1
                         continue
+                    except FileNotFoundError:
+                        pass
+                    try:
+                        chunk_data = _apply_folder_meta(_load_json(chunk_path), folder_meta)
 
-                    # Collect only chunks that haven't been pushed yet
-                    unpushed_chunks = []
-                    chunk_file_paths = {}   # chunk_index -> file path (for marking after push)
-
-                    for chunk_file in sorted(os.listdir(folder_path)):
-                        if not chunk_file.endswith('.json'):
+                        if chunk_data.get('pushed_to_hf'):
+                            index_updates[chunk_file] = chunk_data['pushed_to_hf']
+                            results['chunked']['skipped'] += 1
                             continue
-                        chunk_path = os.path.join(folder_path, chunk_file)
-                        try:
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunk_data = json.load(f)
-
-                            if chunk_data.get('pushed_to_hf'):
-                                results['chunked']['skipped'] += 1
-                                continue
 
-                            unpushed_chunks.append(chunk_data)
-                            chunk_file_paths[chunk_data.get('chunk_index', chunk_file)] = chunk_path
-                        except Exception as e:
-                            current_app.logger.error('Error reading chunk %s: %s', chunk_path, str(e))
-                            results['chunked']['failed'] += 1
-
-                    if not unpushed_chunks:
-                        continue
+                        unpushed_chunks.append(chunk_data)
+                        chunk_file_names[chunk_data.get('chunk_index', chunk_file)] = chunk_file
+                    except Exception as e:
+                        logger.error('Error reading chunk %s: %s', chunk_path, e)
+                        results['chunked']['failed'] += 1
 
+                if unpushed_chunks:
                     # Upload the whole folder's unpushed chunks in one batched request
                     result = hf_service.upload_chunks_batch(folder_name, unpushed_chunks, repo=repo)
 
@@ -1066,21 +1597,27 @@ def push_to_huggingface():
                             f"{folder_name} ({result['uploaded_count']} chunks)"
                         )
 
-                    # Mark successfully-pushed chunks in their JSON files
-                    failed_set = set(result.get('failed_chunks', []))
-                    pushed_at = datetime.utcnow().isoformat() + 'Z'
+                    # Mark successfully-pushed chunks with .pushed sidecars; the
+                    # chunk JSON itself is left untouched
+                    failed_indices = set(result.get('failed_indices', ()))
+                    pushed_at = _now_iso()
                     for chunk_data in unpushed_chunks:
                         chunk_index = chunk_data.get('chunk_index')
-                        chunk_key_name = f'{folder_name}/chunk_{chunk_index:02d}.json'
-                        if chunk_key_name not in failed_set:
-                            chunk_path = chunk_file_paths.get(chunk_index)
-                            if chunk_path and os.path.exists(chunk_path):
+                        if chunk_index not in failed_indices:
+                            chunk_file = chunk_file_names.get(chunk_index)
+                            if chunk_file and os.path.exists(folder_path + os.sep + chunk_file):
                                 try:
-                                    chunk_data['pushed_to_hf'] = pushed_at
-                                    with open(chunk_path, 'w', encoding='utf-8') as f:
-                                        json.dump(chunk_data, f, indent=2, ensure_ascii=False)
+                                    _mark_pushed(folder_path + os.sep + chunk_file, pushed_at)
+                                    index_updates[chunk_file] = pushed_at
                                 except Exception as e:
-                                    current_app.logger.warning('Could not mark chunk as pushed: %s', str(e))
+                                    logger.warning('Could not mark chunk as pushed: %s', e)
+
+                if index_updates:
+                    try:
+                        with _chunk_lock(folder_name):
+                            _update_push_index(folder_path, pushed=index_updates)
+                    except Exception as e:
+                        logger.warning('Could not update push index of %s: %s', folder_name, e)
 
         # ------------------------------------------------------------------
         # Summary
@@ -1095,6 +1632,7 @@ def push_to_huggingface():
                          results['cleaned']['skipped'] +
                          results['chunked']['skipped'])
 
+        _invalidate_stats()
         return jsonify({
             'success': True,
             'message': (
@@ -1111,13 +1649,57 @@ def push_to_huggingface():
         })
 
     except Exception as e:
-        current_app.logger.error('Error pushing to HuggingFace: %s', str(e))
+        logger.exception('Error pushing to HuggingFace')
         return jsonify({
             'success': False,
             'error': f'Failed to push to HuggingFace: {str(e)}',
         }), 500
 
 
+# -----------------------------------------------------------------------------
+# Helper: Background Folder Deletion
+# -----------------------------------------------------------------------------
+# Removing a chunk folder is one unlink per chunk, so delete-approved renames
+# it to a hidden, uniquely named '.<name>.<ns>.deleting' (no valid filename
+# starts with '.') and leaves the rmtree to this small pool. Trash older than
+# STALE_TRASH_SECONDS was orphaned by a worker that died mid-delete; every
+# delete-approved call sweeps it up.
+_TRASH_FMT = '.%s.%d.deleting'.__mod__
+_TRASH_RE = re.compile(r'^\..+\.(\d+)\.deleting$')
+STALE_TRASH_SECONDS = 600
+_DELETE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='admin-delete')
+_SWEEPING = set()   # stale trash paths already queued by this process
+
+
+def _rmtree_logged(path, logger):
+    """rmtree in the background, logging whatever could not be removed."""
+    def _onerror(func, failed_path, exc_info):
+        # Another worker's sweep may be removing the same tree
+        if not issubclass(exc_info[0], FileNotFoundError):
+            logger.warning('Could not remove %s: %s', failed_path, exc_info[1])
+
+    try:
+        shutil.rmtree(path, onerror=_onerror)
+    finally:
+        _SWEEPING.discard(path)
+
+
+def _sweep_stale_trash(logger):
+    """Queue removal of trash folders whose background rmtree never finished."""
+    cutoff = time.time_ns() - STALE_TRASH_SECONDS * 1_000_000_000
+    try:
+        it = os.scandir(Config.APPROVED_CHUNKED_DIR)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            match = _TRASH_RE.match(entry.name)
+            if match and int(match.group(1)) < cutoff and entry.path not in _SWEEPING:
+                _SWEEPING.add(entry.path)
+                logger.info('Removing orphaned trash folder %s', entry.name)
+                _DELETE_POOL.submit(_rmtree_logged, entry.path, logger)
+
+
 # -----------------------------------------------------------------------------
 # DELETE /api/admin/delete-approved  - Delete approved file(s) by stage
 # -----------------------------------------------------------------------------
@@ -1133,55 +1715,54 @@ def delete_approved():
     }
     """
     try:
-        from ..config import Config
-
         data = request.get_json() or {}
         filename = (data.get('filename') or '').strip()
         delete_type = (data.get('type') or 'all').strip().lower()
 
         if not filename:
             return jsonify({'success': False, 'error': 'filename is required'}), 400
+        if not _SAFE_NAME(filename):
+            return jsonify({'success': False, 'error': 'Invalid filename'}), 400
 
+        logger = current_app.logger
+        _sweep_stale_trash(logger)
         deleted = []
 
-        def _remove_raw():
-            raw_content = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
-            raw_meta    = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.meta.json')
-            removed = False
-            for p in (raw_content, raw_meta):
-                if os.path.exists(p):
-                    os.remove(p)
-                    removed = True
-            if removed:
-                deleted.append('raw')
-
-        def _remove_cleaned():
-            cln_content = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
-            cln_meta    = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
+        def _remove_stage(stage_dir, stage):
+            content_path, meta_path = _item_paths(stage_dir, filename, '.txt')
             removed = False
-            for p in (cln_content, cln_meta):
-                if os.path.exists(p):
+            for p in (content_path, meta_path, meta_path + PUSHED_SUFFIX):
+                try:
                     os.remove(p)
                     removed = True
+                except FileNotFoundError:
+                    pass
             if removed:
-                deleted.append('cleaned')
+                deleted.append(stage)
 
         def _remove_chunks():
-            chunks_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-            if os.path.exists(chunks_dir) and os.path.isdir(chunks_dir):
-                shutil.rmtree(chunks_dir)
-                deleted.append('chunks')
+            # One rename takes the folder out of every listing right away;
+            # unlinking its chunks happens in the background.
+            chunked_prefix = Config.APPROVED_CHUNKED_DIR + os.sep
+            trash_dir = chunked_prefix + _TRASH_FMT((filename, time.time_ns()))
+            try:
+                os.rename(chunked_prefix + filename, trash_dir)
+            except FileNotFoundError:
+                return
+            _DELETE_POOL.submit(_rmtree_logged, trash_dir, logger)
+            deleted.append('chunks')
 
         if delete_type in ('raw', 'all'):
-            _remove_raw()
+            _remove_stage(Config.APPROVED_RAW_DIR, 'raw')
         if delete_type in ('cleaned', 'all'):
-            _remove_cleaned()
+            _remove_stage(Config.APPROVED_CLEANED_DIR, 'cleaned')
         if delete_type in ('chunks', 'all'):
             _remove_chunks()
 
         if not deleted:
             return jsonify({'success': False, 'error': f'Nothing found to delete for "{filename}" ({delete_type})'}), 404
 
+        _invalidate_stats()
         current_app.logger.info('Deleted approved %s for %s', deleted, filename)
         return jsonify({
             'success': True,
@@ -1190,5 +1771,5 @@ def delete_approved():
         })
 
     except Exception as e:
-        current_app.logger.error('Error deleting approved file: %s', str(e))
+        current_app.logger.exception('Error deleting approved file')
         return jsonify({'success': False, 'error': f'Delete failed: {str(e)}'}), 500
\ No newline at end of file
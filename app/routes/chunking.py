@@ -39,6 +39,8 @@ import fcntl
 from datetime import datetime
 import uuid
 
+from ..config import Config
+
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
@@ -111,7 +113,6 @@ def _chunk_lock(filename: str):
         with _chunk_lock(filename):
             # safe: calculate index + save file here
     """
-    from ..config import Config
     lock_dir = os.path.join(Config.PENDING_CHUNKED_DIR, '_locks')
     os.makedirs(lock_dir, exist_ok=True)
     lock_path = os.path.join(lock_dir, f'{filename}.lock')
@@ -135,7 +136,6 @@ def list_cleaned_files():
         JSON: Array of cleaned files with content and chunking status
     """
     try:
-        from ..config import Config
         approved_cleaned_dir = Config.APPROVED_CLEANED_DIR
         
         cleaned_files = []
@@ -143,7 +143,7 @@ def list_cleaned_files():
         if os.path.exists(approved_cleaned_dir):
             for filename in os.listdir(approved_cleaned_dir):
                 if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
+                    base_name = filename[:-4]
                     
                     # Read content
                     content_path = os.path.join(approved_cleaned_dir, filename)
@@ -153,9 +153,11 @@ def list_cleaned_files():
                     # Read metadata
                     meta_path = os.path.join(approved_cleaned_dir, f'{base_name}.meta.json')
                     metadata = {}
-                    if os.path.exists(meta_path):
+                    try:
                         with open(meta_path, 'r', encoding='utf-8') as f:
                             metadata = json.load(f)
+                    except FileNotFoundError:
+                        pass
                     
                     # Count existing chunks (pending + approved)
                     pending_chunks = 0
@@ -165,10 +167,10 @@ def list_cleaned_files():
                     approved_chunk_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, base_name)
                     
                     if os.path.exists(pending_chunk_dir):
-                        pending_chunks = len([f for f in os.listdir(pending_chunk_dir) if f.endswith('.json')])
+                        pending_chunks = len([f for f in os.listdir(pending_chunk_dir) if f.endswith('.json') and not f.startswith('_')])
                     
                     if os.path.exists(approved_chunk_dir):
-                        approved_chunks = len([f for f in os.listdir(approved_chunk_dir) if f.endswith('.json')])
+                        approved_chunks = len([f for f in os.listdir(approved_chunk_dir) if f.endswith('.json') and not f.startswith('_')])
                     
                     cleaned_files.append({
                         'filename': base_name,
@@ -210,15 +212,13 @@ def get_chunks(filename):
         JSON: Array of chunk objects
     """
     try:
-        from ..config import Config
-        
         chunks = []
         
         # Get pending chunks
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
         if os.path.exists(pending_dir):
             for chunk_file in os.listdir(pending_dir):
-                if chunk_file.endswith('.json'):
+                if chunk_file.endswith('.json') and not chunk_file.startswith('_'):
                     chunk_path = os.path.join(pending_dir, chunk_file)
                     with open(chunk_path, 'r', encoding='utf-8') as f:
                         chunk = json.load(f)
@@ -229,7 +229,7 @@ def get_chunks(filename):
         approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
         if os.path.exists(approved_dir):
             for chunk_file in os.listdir(approved_dir):
-                if chunk_file.endswith('.json'):
+                if chunk_file.endswith('.json') and not chunk_file.startswith('_'):
                     chunk_path = os.path.join(approved_dir, chunk_file)
                     with open(chunk_path, 'r', encoding='utf-8') as f:
                         chunk = json.load(f)
@@ -296,8 +296,6 @@ def submit_chunk():
         heading = data.get('heading', '')
         sub_heading = data.get('sub_heading', '')
         
-        from ..config import Config
-        
         # Verify cleaned file exists
         cleaned_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
         if not os.path.exists(cleaned_path):
@@ -316,11 +314,13 @@ def submit_chunk():
         
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
         approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-        os.makedirs(pending_dir, exist_ok=True)
 
         # Calculate index AND save the file inside the per-filename exclusive
         # lock so two simultaneous requests never claim the same chunk_index.
+        # (The pending folder is created under the lock too: admin approve-all
+        # may move it away while holding the same lock.)
         with _chunk_lock(filename):
+            os.makedirs(pending_dir, exist_ok=True)
             chunk_index = _calc_max_index(pending_dir, approved_dir)
             chunk_id = generate_chunk_id(language, category, filename, chunk_index)
             chunk = {
@@ -396,8 +396,6 @@ def submit_batch():
                 'error': 'Chunks must be a non-empty array'
             }), 400
         
-        from ..config import Config
-        
         # Verify cleaned file exists
         cleaned_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
         if not os.path.exists(cleaned_path):
@@ -418,15 +416,14 @@ def submit_batch():
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
         approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
 
-        # Create pending directory
-        os.makedirs(pending_dir, exist_ok=True)
-
         created_chunks = []
 
         # Hold the exclusive lock for the entire batch so all chunks in this
         # batch get consecutive indices and no concurrent request can grab the
         # same index.
         with _chunk_lock(filename):
+            # Create pending directory (under the lock - see submit_chunk)
+            os.makedirs(pending_dir, exist_ok=True)
             start_index = _calc_max_index(pending_dir, approved_dir)
 
             for i, chunk_data in enumerate(chunks_data):
@@ -483,7 +480,6 @@ def list_pending():
         JSON: Array of pending chunks grouped by source file
     """
     try:
-        from ..config import Config
         pending_base = Config.PENDING_CHUNKED_DIR
         
         pending_files = {}
@@ -494,7 +490,7 @@ def list_pending():
                 if os.path.isdir(folder_path):
                     chunks = []
                     for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
+                        if chunk_file.endswith('.json') and not chunk_file.startswith('_'):
                             chunk_path = os.path.join(folder_path, chunk_file)
                             with open(chunk_path, 'r', encoding='utf-8') as f:
                                 chunk = json.load(f)
@@ -537,8 +533,6 @@ def delete_chunk(filename, chunk_index):
         JSON: Success/error response
     """
     try:
-        from ..config import Config
-        
         chunk_file = f'chunk_{chunk_index:02d}.json'
         chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
         
@@ -26,6 +26,8 @@ import json
 from datetime import datetime
 import uuid
 
+from ..config import Config
+
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
@@ -49,7 +51,6 @@ def list_raw_files():
         JSON: Array of raw files available for cleaning
     """
     try:
-        from ..config import Config
         approved_raw_dir = Config.APPROVED_RAW_DIR
         
         raw_files = []
@@ -58,7 +59,7 @@ def list_raw_files():
         if os.path.exists(approved_raw_dir):
             for filename in os.listdir(approved_raw_dir):
                 if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
+                    base_name = filename[:-4]
                     meta_path = os.path.join(approved_raw_dir, f'{base_name}.meta.json')
                     
                     # Read content preview and metadata
@@ -67,9 +68,11 @@ def list_raw_files():
                         content = f.read()
                     
                     metadata = {}
-                    if os.path.exists(meta_path):
+                    try:
                         with open(meta_path, 'r', encoding='utf-8') as f:
                             metadata = json.load(f)
+                    except FileNotFoundError:
+                        pass
                     
                     # Check if already cleaned
                     cleaned_pending = os.path.exists(
@@ -136,8 +139,6 @@ def submit_cleaned_data():
         filename = data['filename'].strip()
         content = data['content']
         
-        from ..config import Config
-        
         # Verify that the raw file exists
         raw_path = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
         if not os.path.exists(raw_path):
@@ -212,7 +213,6 @@ def list_pending():
         JSON: Array of pending cleaned file metadata
     """
     try:
-        from ..config import Config
         pending_dir = Config.PENDING_CLEANED_DIR
         
         pending_files = []
@@ -253,7 +253,6 @@ def list_approved():
         JSON: Array of approved cleaned file metadata
     """
     try:
-        from ..config import Config
         approved_dir = Config.APPROVED_CLEANED_DIR
         
         approved_files = []
@@ -297,8 +296,6 @@ def get_file_content(filename):
         JSON: File content and metadata
     """
     try:
-        from ..config import Config
-        
         # Check pending first
         pending_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
         pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
@@ -14,6 +14,8 @@ The main blueprint uses no URL prefix, so routes are at the root level.
 
 from flask import Blueprint, render_template, jsonify, current_app
 
+from ..config import Config
+
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
@@ -77,8 +79,6 @@ def get_config():
     Returns:
         JSON: Configuration object with languages, categories, sources
     """
-    from ..config import Config
-    
     return jsonify({
         'languages': Config.SUPPORTED_LANGUAGES,
         'defaultLanguage': Config.DEFAULT_LANGUAGE,
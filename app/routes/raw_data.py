@@ -24,6 +24,8 @@ import json
 from datetime import datetime
 import uuid
 
+from ..config import Config
+
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
@@ -110,7 +112,6 @@ def submit_raw_data():
         metadata = generate_metadata(filename, language, source, content)
         
         # Get pending directory path from config
-        from ..config import Config
         pending_dir = Config.PENDING_RAW_DIR
         
         # Create file paths
@@ -161,7 +162,6 @@ def list_pending():
         JSON: Array of pending file metadata
     """
     try:
-        from ..config import Config
         pending_dir = Config.PENDING_RAW_DIR
         
         pending_files = []
@@ -206,7 +206,6 @@ def list_approved():
         JSON: Array of approved file metadata
     """
     try:
-        from ..config import Config
         approved_dir = Config.APPROVED_RAW_DIR
         
         approved_files = []
@@ -254,8 +253,6 @@ def get_file_content(filename):
         JSON: File content and metadata
     """
     try:
-        from ..config import Config
-        
         # Check pending directory first
         pending_content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
         pending_meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
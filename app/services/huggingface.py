@@ -21,12 +21,100 @@ import os
 import json
 import time
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from importlib.util import find_spec
+from typing import Optional, List, Dict, Any, Tuple
+
+# hf_transfer (optional, `pip install hf_transfer`) downloads over several
+# parallel connections. huggingface_hub reads this flag at import time and
+# fails downloads if it is set without the package, so only turn it on when
+# hf_transfer is installed; an explicit HF_HUB_ENABLE_HF_TRANSFER wins.
+if find_spec('hf_transfer') is not None:
+    os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')
+
 from huggingface_hub import HfApi, hf_hub_download, CommitOperationAdd
 from huggingface_hub.utils import RepositoryNotFoundError, HfHubHTTPError
 
+from ..config import Config
+
+# orjson emits UTF-8 bytes directly and (de)serializes large chunk payloads
+# several times faster than the stdlib; json is only a fallback.
+# Metadata sidecars are pretty-printed for people browsing the repo; chunk
+# .json files are machine-consumed and go up compact (indent=False).
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_bytes(obj, indent=True):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_bytes(obj, indent=True):
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# Chunks-per-commit ladder walked by _commit_payloads, and the commit
+# duration below which a batch counts as "fast" (step up one size).
+COMMIT_BATCH_SIZES = (20, 50, 75, 100, 125, 150, 200, 250, 400, 600, 1000)
+FAST_COMMIT_SECONDS = 40
+
+# How long a repo's list_repo_files result is reused before re-fetching
+REPO_LIST_TTL = 60.0
+
+# Upper bound on a Retry-After wait, since the retry blocks a request thread
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Commits in flight across every request in this process. Each push or
+# sync runs its own thread pools, so without a shared cap several users
+# pushing at once would multiply the load on the Hub's commit rate limit.
+_COMMIT_SLOTS = threading.BoundedSemaphore(max(1, Config.HF_MAX_CONCURRENT_COMMITS))
+
+
+def _read_json(path: str) -> Any:
+    """Read and parse one JSON file."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _is_timeout(error: Exception) -> bool:
+    """True for a gateway timeout from the Hub or a client-side timeout."""
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 504:
+        return True
+    return isinstance(error, TimeoutError) or 'Timeout' in type(error).__name__
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    False for client errors another attempt cannot fix (bad token, missing
+    repo, invalid operations); rate limits, server errors and network
+    failures without a response are worth retrying.
+    """
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status is None or status in (408, 429) or status >= 500
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the Hub asked us to wait (Retry-After on a 429), if any."""
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) != 429:
+        return None
+    try:
+        delay = float(response.headers.get('Retry-After'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+
 
 class HuggingFaceService:
     """
@@ -50,12 +138,17 @@ class HuggingFaceService:
         
         # Initialize HuggingFace API client
         self.api = HfApi(token=self.token) if self.token else None
+        # Neither changes after construction, so check them once
+        self._configured = bool(self.token and self.api)
         
         # Repository names from config
-        from ..config import Config
         self.raw_repo = Config.HF_RAW_REPO
         self.cleaned_repo = Config.HF_CLEANED_REPO
         self.chunked_repo = Config.HF_CHUNKED_REPO
+        
+        # repo_id -> (fetched or invalidated at, list_repo_files result or None)
+        self._file_list_cache: Dict[str, tuple] = {}
+        self._file_list_lock = threading.Lock()
     
     def is_configured(self) -> bool:
         """
@@ -64,7 +157,7 @@ class HuggingFaceService:
         Returns:
             bool: True if token and repos are configured
         """
-        return bool(self.token and self.api)
+        return self._configured
     
     # -------------------------------------------------------------------------
     # Upload Operations
@@ -83,6 +176,28 @@ class HuggingFaceService:
         Returns:
             dict: Result with success status and message
         """
+        return self._upload_raw(filename, content.encode('utf-8'), metadata, repo)
+    
+    def upload_raw_file_from_path(self, filename: str, content_path: str, metadata: Dict[str, Any], repo: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Upload a raw data file straight from disk.
+        
+        Same as upload_raw_file, but the text is never loaded into memory:
+        huggingface_hub reads content_path in chunks while uploading.
+        
+        Args:
+            filename: Name of the file (without extension)
+            content_path: Path of the local .txt file
+            metadata: File metadata dictionary
+            repo: Optional custom repository name (overrides default)
+        
+        Returns:
+            dict: Result with success status and message
+        """
+        return self._upload_raw(filename, content_path, metadata, repo)
+    
+    def _upload_raw(self, filename: str, payload, metadata: Dict[str, Any], repo: Optional[str]) -> Dict[str, Any]:
+        """Commit a raw .txt (bytes or local path) plus its metadata."""
         if not self.is_configured():
             return {
                 'success': False,
@@ -96,19 +211,14 @@ class HuggingFaceService:
             operations = [
                 CommitOperationAdd(
                     path_in_repo=f'{filename}.txt',
-                    path_or_fileobj=content.encode('utf-8'),
+                    path_or_fileobj=payload,
                 ),
                 CommitOperationAdd(
                     path_in_repo=f'{filename}.meta.json',
-                    path_or_fileobj=json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8'),
+                    path_or_fileobj=_dumps_bytes(metadata),
                 ),
             ]
-            self.api.create_commit(
-                repo_id=target_repo,
-                repo_type='dataset',
-                operations=operations,
-                commit_message=f'Add raw file: {filename}',
-            )
+            self._commit(target_repo, operations, f'Add raw file: {filename}')
 
             return {
                 'success': True,
@@ -145,6 +255,25 @@ class HuggingFaceService:
         Returns:
             dict: Result with success status and message
         """
+        return self._upload_cleaned(filename, content.encode('utf-8'), repo)
+    
+    def upload_cleaned_file_from_path(self, filename: str, content_path: str, metadata: Dict[str, Any], repo: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Upload a cleaned data file straight from disk (see upload_raw_file_from_path).
+        
+        Args:
+            filename: Name of the file
+            content_path: Path of the local .txt file
+            metadata: File metadata dictionary (not pushed)
+            repo: Optional custom repository name (overrides default)
+        
+        Returns:
+            dict: Result with success status and message
+        """
+        return self._upload_cleaned(filename, content_path, repo)
+    
+    def _upload_cleaned(self, filename: str, payload, repo: Optional[str]) -> Dict[str, Any]:
+        """Commit a cleaned .txt given as bytes or a local path."""
         if not self.is_configured():
             return {
                 'success': False,
@@ -157,17 +286,12 @@ class HuggingFaceService:
             operations = [
                 CommitOperationAdd(
                     path_in_repo=f'{filename}.txt',
-                    path_or_fileobj=content.encode('utf-8'),
+                    path_or_fileobj=payload,
                 ),
                 # NOTE: meta.json intentionally NOT pushed to cleaned repo
                 #       — only the plain text file is uploaded.
             ]
-            self.api.create_commit(
-                repo_id=target_repo,
-                repo_type='dataset',
-                operations=operations,
-                commit_message=f'Add cleaned file: {filename}',
-            )
+            self._commit(target_repo, operations, f'Add cleaned file: {filename}')
 
             return {
                 'success': True,
@@ -193,13 +317,12 @@ class HuggingFaceService:
 
         try:
             chunk_filename = f'{folder_name}/{chunk_file}'
-            chunk_content = json.dumps(chunk_data, indent=2, ensure_ascii=False).encode('utf-8')
+            chunk_content = _dumps_bytes(chunk_data, indent=False)
 
-            self.api.create_commit(
-                repo_id=target_repo,
-                repo_type='dataset',
-                operations=[CommitOperationAdd(path_in_repo=chunk_filename, path_or_fileobj=chunk_content)],
-                commit_message=f'Add {chunk_file} for {folder_name}',
+            self._commit(
+                target_repo,
+                [CommitOperationAdd(path_in_repo=chunk_filename, path_or_fileobj=chunk_content)],
+                f'Add {chunk_file} for {folder_name}',
             )
 
             return {
@@ -211,12 +334,122 @@ class HuggingFaceService:
         except Exception as e:
             return {'success': False, 'error': f'Upload failed: {str(e)}'}
 
+    def _commit(self, target_repo: str, operations: list, commit_message: str) -> None:
+        """
+        create_commit on a dataset repo, holding one of the process-wide
+        commit slots, then drop the repo's cached file list.
+        """
+        with _COMMIT_SLOTS:
+            self.api.create_commit(
+                repo_id=target_repo,
+                repo_type='dataset',
+                operations=operations,
+                commit_message=commit_message,
+            )
+        self._invalidate_file_list(target_repo)
+
+    def _commit_with_retry(self, target_repo: str, operations: list, commit_message: str, max_retries: int = 3) -> Optional[Exception]:
+        """
+        Run one create_commit, retrying with exponential back-off (2s, 4s, ...).
+
+        A 429 waits for the Retry-After the Hub sent instead, and client
+        errors that cannot succeed on a retry (401, 404, ...) are returned
+        straight away.
+
+        Returns:
+            None on success, otherwise the error of the final attempt
+        """
+        for attempt in range(1, max_retries + 1):
+            try:
+                self._commit(target_repo, operations, commit_message)
+                return None
+            except Exception as e:
+                if attempt == max_retries or not _is_retryable(e):
+                    return e
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = 2 ** attempt
+                logger.warning(
+                    'HF rate-limit / transient error on "%s" (attempt %d/%d). '
+                    'Retrying in %gs. Error: %s',
+                    commit_message, attempt, max_retries, delay, e,
+                )
+                time.sleep(delay)
+
+    def _commit_payloads(
+        self,
+        target_repo: str,
+        payloads: List[Tuple[str, bytes]],
+        label: str,
+        batch_size: int = 50,
+        max_workers: int = 4,
+    ) -> List[int]:
+        """
+        Commit (path_in_repo, bytes) pairs in adaptively sized batches.
+
+        Up to max_workers batches are committed at once, since each commit
+        is mostly spent waiting on the network.
+
+        Returns:
+            Positions in ``payloads`` whose batch permanently failed
+        """
+        failed: List[int] = []
+
+        # Batch size adapts as commits complete: a fast success moves one
+        # step above the rung that batch was cut at, a timeout two steps
+        # below it, anything else (e.g. a 429) keeps the current size. Steps
+        # are relative to the batch's own rung so concurrent commits
+        # reporting the same signal move the size once, not once each.
+        # batch_size picks the starting rung.
+        size_idx = min(bisect_left(COMMIT_BATCH_SIZES, batch_size), len(COMMIT_BATCH_SIZES) - 1)
+        next_start = 0
+        in_flight = {}   # future -> (batch range, rung, submitted at)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='hf-commit') as pool:
+
+            def _submit_next():
+                nonlocal next_start
+                stop = min(next_start + COMMIT_BATCH_SIZES[size_idx], len(payloads))
+                operations = [
+                    CommitOperationAdd(path_in_repo=path, path_or_fileobj=payload)
+                    for path, payload in payloads[next_start:stop]
+                ]
+                commit_message = f'Add chunks {next_start + 1}-{stop} for {label}'
+                future = pool.submit(self._commit_with_retry, target_repo, operations, commit_message)
+                in_flight[future] = (range(next_start, stop), size_idx, time.monotonic())
+                next_start = stop
+
+            while next_start < len(payloads) and len(in_flight) < max_workers:
+                _submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    positions, rung, started = in_flight.pop(future)
+                    elapsed = time.monotonic() - started
+                    error = future.result()
+                    if error is None:
+                        if elapsed < FAST_COMMIT_SECONDS:
+                            size_idx = max(size_idx, min(rung + 1, len(COMMIT_BATCH_SIZES) - 1))
+                    else:
+                        # Final attempt failed — record the failed chunks
+                        failed.extend(positions)
+                        logger.error('Batch upload permanently failed: %s', error)
+                        if _is_timeout(error):
+                            size_idx = min(size_idx, max(rung - 2, 0))
+                # Refill freed slots with batches cut at the updated size
+                while next_start < len(payloads) and len(in_flight) < max_workers:
+                    _submit_next()
+
+        return failed
+
     def upload_chunks_batch(
         self,
         folder_name: str,
         chunks: List[Dict[str, Any]],
         repo: Optional[str] = None,
         batch_size: int = 50,
+        max_workers: int = 4,
     ) -> Dict[str, Any]:
         """
         Upload many chunks in batched create_commit calls.
@@ -224,80 +457,39 @@ class HuggingFaceService:
         Instead of one API call per chunk (which triggers HuggingFace rate
         limits for large sets like 223 chunks), we group chunks into batches
         and push each batch as a SINGLE commit.  This is drastically faster
-        and avoids rate-limiting / timeout failures.
+        and avoids rate-limiting / timeout failures.  Up to max_workers
+        batches are committed at once, since each commit is mostly spent
+        waiting on the network.
 
         Args:
             folder_name: Name of the folder (source file name)
             chunks: List of chunk dicts to upload
             repo: Optional custom repository name
-            batch_size: How many chunks per commit (default 50)
+            batch_size: Chunks in the first commits (default 50); later
+                        batches grow or shrink with commit latency
+            max_workers: How many commits may be in flight at once (default 4)
 
         Returns:
-            dict with success status, uploaded count, and per-chunk errors
+            dict with success status, uploaded count, and per-chunk errors.
+            Failed chunks are reported both as repo paths ('failed_chunks')
+            and as their chunk_index values ('failed_indices').
         """
         if not self.is_configured():
             return {'success': False, 'error': 'HuggingFace not configured'}
 
         target_repo = repo or self.chunked_repo
-        uploaded_count = 0
-        failed_chunks: List[str] = []
-        MAX_RETRIES = 3
-
-        # Split into batches
-        for batch_start in range(0, len(chunks), batch_size):
-            batch = chunks[batch_start: batch_start + batch_size]
-            operations = []
-
-            for chunk in batch:
-                chunk_index = chunk.get('chunk_index', 1)
-                chunk_filename = f'{folder_name}/chunk_{chunk_index:02d}.json'
-                chunk_content = json.dumps(chunk, indent=2, ensure_ascii=False).encode('utf-8')
-                operations.append(
-                    CommitOperationAdd(path_in_repo=chunk_filename, path_or_fileobj=chunk_content)
-                )
 
-            # Retry the whole batch up to MAX_RETRIES times
-            for attempt in range(1, MAX_RETRIES + 1):
-                try:
-                    self.api.create_commit(
-                        repo_id=target_repo,
-                        repo_type='dataset',
-                        operations=operations,
-                        commit_message=(
-                            f'Add chunks {batch_start + 1}-{batch_start + len(batch)} for {folder_name}'
-                        ),
-                    )
-                    uploaded_count += len(batch)
-                    break  # success — move to next batch
-                except HfHubHTTPError as e:
-                    status = getattr(e, 'response', None)
-                    status_code = status.status_code if status is not None else 0
-                    if status_code == 429 or attempt < MAX_RETRIES:
-                        wait = 2 ** attempt  # exponential back-off: 2s, 4s, 8s
-                        logger.warning(
-                            'HF rate-limit / transient error on batch %d-%d (attempt %d/%d). '
-                            'Retrying in %ds. Error: %s',
-                            batch_start + 1, batch_start + len(batch), attempt, MAX_RETRIES, wait, e,
-                        )
-                        time.sleep(wait)
-                    else:
-                        # Final attempt failed — record failed chunk IDs
-                        for chunk in batch:
-                            failed_chunks.append(
-                                f'{folder_name}/chunk_{chunk.get("chunk_index", "?"):02d}.json'
-                            )
-                        logger.error('Batch upload permanently failed: %s', e)
-                        break
-                except Exception as e:
-                    if attempt < MAX_RETRIES:
-                        time.sleep(2 ** attempt)
-                    else:
-                        for chunk in batch:
-                            failed_chunks.append(
-                                f'{folder_name}/chunk_{chunk.get("chunk_index", "?"):02d}.json'
-                            )
-                        logger.error('Batch upload error: %s', e)
-                        break
+        # Encode every chunk once up front so refilling a commit slot only
+        # slices ready-made (path, bytes) pairs instead of serializing JSON
+        # while other commits are waiting to be collected.
+        payloads = [
+            (f'{folder_name}/chunk_{chunk.get("chunk_index", 1):02d}.json', _dumps_bytes(chunk, indent=False))
+            for chunk in chunks
+        ]
+        failed = self._commit_payloads(target_repo, payloads, folder_name, batch_size, max_workers)
+        failed_chunks = [payloads[i][0] for i in failed]
+        failed_indices = [chunks[i].get('chunk_index', 1) for i in failed]
+        uploaded_count = len(chunks) - len(failed)
 
         success = len(failed_chunks) == 0
         return {
@@ -307,6 +499,7 @@ class HuggingFaceService:
             'uploaded_count': uploaded_count,
             'failed_count': len(failed_chunks),
             'failed_chunks': failed_chunks,
+            'failed_indices': failed_indices,
         }
 
     def upload_chunks(self, folder_name: str, chunks: List[Dict[str, Any]], repo: Optional[str] = None) -> Dict[str, Any]:
@@ -315,10 +508,91 @@ class HuggingFaceService:
         """
         return self.upload_chunks_batch(folder_name, chunks, repo=repo)
 
+    def upload_multi_folder_chunks(
+        self,
+        folders: Dict[str, List[Dict[str, Any]]],
+        repo: Optional[str] = None,
+        batch_size: int = 50,
+        max_workers: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Upload the chunks of several folders through one shared set of commits.
+
+        Where upload_chunks_batch makes at least one commit per folder, this
+        packs chunks from different folders into the same commits, so a
+        sync of many small folders costs a handful of commits instead of
+        one each (the Hub limits commits per hour).
+
+        Args:
+            folders: Folder name -> list of chunk dicts
+            repo: Optional custom repository name
+            batch_size: Chunks in the first commits (default 50)
+            max_workers: How many commits may be in flight at once (default 4)
+
+        Returns:
+            dict with success status, uploaded count, and 'failed_folders'
+            mapping each folder with failed chunks to their repo paths.
+        """
+        if not self.is_configured():
+            return {'success': False, 'error': 'HuggingFace not configured'}
+
+        target_repo = repo or self.chunked_repo
+
+        payloads = []
+        owners = []
+        for folder_name, chunks in folders.items():
+            for chunk in chunks:
+                payloads.append((
+                    f'{folder_name}/chunk_{chunk.get("chunk_index", 1):02d}.json',
+                    _dumps_bytes(chunk, indent=False),
+                ))
+                owners.append(folder_name)
+
+        failed = self._commit_payloads(target_repo, payloads, f'{len(folders)} folders', batch_size, max_workers)
+        failed_folders: Dict[str, List[str]] = {}
+        for i in failed:
+            failed_folders.setdefault(owners[i], []).append(payloads[i][0])
+        uploaded_count = len(payloads) - len(failed)
+
+        return {
+            'success': not failed,
+            'message': f'Uploaded {uploaded_count} chunks ({len(failed)} failed) to {target_repo}',
+            'repo': target_repo,
+            'uploaded_count': uploaded_count,
+            'failed_count': len(failed),
+            'failed_folders': failed_folders,
+        }
+
     # -------------------------------------------------------------------------
     # Download Operations
     # -------------------------------------------------------------------------
     
+    def _list_repo_files(self, repo: str) -> List[str]:
+        """
+        list_repo_files for a dataset repo, cached for REPO_LIST_TTL seconds.
+        
+        Commits made through this service drop their repo's entry, so the
+        cache only hides changes made elsewhere, for at most the TTL.
+        """
+        with self._file_list_lock:
+            cached = self._file_list_cache.get(repo)
+        if cached is not None and cached[1] is not None and time.monotonic() - cached[0] < REPO_LIST_TTL:
+            return cached[1]
+        
+        fetched_at = time.monotonic()
+        files = self.api.list_repo_files(repo_id=repo, repo_type='dataset')
+        with self._file_list_lock:
+            # Don't store a listing that a commit landing mid-fetch made stale
+            current = self._file_list_cache.get(repo)
+            if current is None or current[0] <= fetched_at:
+                self._file_list_cache[repo] = (fetched_at, files)
+        return files
+    
+    def _invalidate_file_list(self, repo: str) -> None:
+        """Forget the cached file list of ``repo`` after a commit to it."""
+        with self._file_list_lock:
+            self._file_list_cache[repo] = (time.monotonic(), None)
+    
     def list_raw_files(self) -> Dict[str, Any]:
         """
         List all files in the raw data repository.
@@ -333,13 +607,10 @@ class HuggingFaceService:
             }
         
         try:
-            files = self.api.list_repo_files(
-                repo_id=self.raw_repo,
-                repo_type='dataset'
-            )
+            files = self._list_repo_files(self.raw_repo)
             
             # Filter to only .txt files
-            txt_files = [f.replace('.txt', '') for f in files if f.endswith('.txt')]
+            txt_files = [f[:-4] for f in files if f.endswith('.txt')]
             
             return {
                 'success': True,
@@ -412,86 +683,182 @@ class HuggingFaceService:
     # Sync Operations
     # -------------------------------------------------------------------------
     
-    def sync_all_approved(self) -> Dict[str, Any]:
+    def _sync_text_file(self, stage_dir: str, base_name: str, upload_fn, has_meta: bool = True) -> Dict[str, Any]:
+        """Read one raw/cleaned item's metadata and upload it (sync worker)."""
+        content_path = os.path.join(stage_dir, f'{base_name}.txt')
+        meta_path = os.path.join(stage_dir, f'{base_name}.meta.json')
+        
+        metadata = {}
+        if has_meta:
+            try:
+                with open(meta_path, 'rb') as f:
+                    metadata = _loads(f.read())
+            except FileNotFoundError:
+                pass
+        
+        return upload_fn(base_name, content_path, metadata)
+    
+    def _remote_files(self, repo: str) -> set:
+        """Paths already in ``repo`` (empty - sync everything - if listing fails)."""
+        try:
+            return set(self._list_repo_files(repo))
+        except Exception as e:
+            logger.warning('Could not list %s, syncing everything: %s', repo, e)
+            return set()
+    
+    def _read_chunk_folder(self, folder_name: str, folder_path: str, remote: set, pool: ThreadPoolExecutor) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read the chunks of one approved folder that are missing from
+        ``remote``. The chunk files are read on ``pool`` so their disk
+        reads overlap.
+        
+        Returns:
+            (chunks to upload, number already in the repo)
+        """
+        names = os.listdir(folder_path)
+        
+        # Folder-level approval info from an approve-all rename
+        folder_meta = {}
+        if '_folder.meta.json' in names:
+            try:
+                with open(os.path.join(folder_path, '_folder.meta.json'), 'rb') as f:
+                    folder_meta = _loads(f.read())
+            except FileNotFoundError:
+                pass
+        
+        chunk_paths = []
+        already_synced = 0
+        for chunk_file in names:
+            if chunk_file.endswith('.json') and not chunk_file.startswith('_'):
+                if f'{folder_name}/{chunk_file}' in remote:
+                    already_synced += 1
+                    continue
+                chunk_paths.append(os.path.join(folder_path, chunk_file))
+        
+        chunks = list(pool.map(_read_json, chunk_paths))
+        if folder_meta:
+            for chunk in chunks:
+                if 'approved_at' not in chunk:
+                    chunk.update(folder_meta)
+        
+        return chunks, already_synced
+    
+    def _sync_chunk_folders(self, folder_paths: Dict[str, str], remote: set) -> Dict[str, int]:
+        """
+        Upload the missing chunks of every approved folder in shared
+        multi-folder commits (sync worker).
+        
+        Returns:
+            dict: success / failed / skipped folder counts
+        """
+        counts = {'success': 0, 'failed': 0, 'skipped': 0}
+        pending = {}
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix='hf-read') as read_pool:
+            for folder_name, folder_path in folder_paths.items():
+                try:
+                    chunks, already_synced = self._read_chunk_folder(folder_name, folder_path, remote, read_pool)
+                except Exception as e:
+                    logger.error('Could not read chunk folder %s: %s', folder_name, e)
+                    counts['failed'] += 1
+                    continue
+                if chunks:
+                    pending[folder_name] = chunks
+                elif already_synced:
+                    counts['skipped'] += 1
+        
+        if pending:
+            result = self.upload_multi_folder_chunks(pending)
+            failed_folders = result.get('failed_folders', {})
+            if not result['success'] and not failed_folders:
+                # Nothing was attempted (e.g. HuggingFace not configured)
+                failed_folders = pending
+            counts['failed'] += len(failed_folders)
+            counts['success'] += len(pending) - len(failed_folders)
+        return counts
+    
+    def sync_all_approved(self, max_workers: int = 8) -> Dict[str, Any]:
         """
         Sync all approved local files to HuggingFace.
         
         This is a batch operation that uploads all approved files
-        that haven't been synced yet.
+        that haven't been synced yet: anything whose path already exists in
+        the target repo is skipped, so re-running a sync creates no commits
+        for it. Files are read and uploaded on a pool of max_workers
+        threads, so their network round trips overlap; chunks from all
+        folders are packed into shared commits.
         
         Returns:
             dict: Sync results with counts
         """
-        from ..config import Config
-        
         results = {
-            'raw': {'success': 0, 'failed': 0},
-            'cleaned': {'success': 0, 'failed': 0},
-            'chunked': {'success': 0, 'failed': 0}
+            'raw': {'success': 0, 'failed': 0, 'skipped': 0},
+            'cleaned': {'success': 0, 'failed': 0, 'skipped': 0},
+            'chunked': {'success': 0, 'failed': 0, 'skipped': 0}
         }
         
-        # Sync raw files
-        if os.path.exists(Config.APPROVED_RAW_DIR):
-            for filename in os.listdir(Config.APPROVED_RAW_DIR):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    content_path = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-                    
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    result = self.upload_raw_file(base_name, content, metadata)
-                    if result['success']:
-                        results['raw']['success'] += 1
-                    else:
-                        results['raw']['failed'] += 1
-        
-        # Sync cleaned files
-        if os.path.exists(Config.APPROVED_CLEANED_DIR):
-            for filename in os.listdir(Config.APPROVED_CLEANED_DIR):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    content_path = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-                    
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    result = self.upload_cleaned_file(base_name, content, metadata)
-                    if result['success']:
-                        results['cleaned']['success'] += 1
-                    else:
-                        results['cleaned']['failed'] += 1
-        
-        # Sync chunks
-        if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-            for folder_name in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder_name)
-                if os.path.isdir(folder_path):
-                    chunks = []
-                    for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
-                            chunk_path = os.path.join(folder_path, chunk_file)
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunks.append(json.load(f))
-                    
-                    if chunks:
-                        result = self.upload_chunks(folder_name, chunks)
-                        if result['success']:
-                            results['chunked']['success'] += 1
-                        else:
-                            results['chunked']['failed'] += 1
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hf-sync') as pool:
+            futures = {}
+            
+            # Raw and cleaned files
+            for stage, stage_dir, repo, upload_fn in (
+                ('raw', Config.APPROVED_RAW_DIR, self.raw_repo, self.upload_raw_file_from_path),
+                ('cleaned', Config.APPROVED_CLEANED_DIR, self.cleaned_repo, self.upload_cleaned_file_from_path),
+            ):
+                try:
+                    filenames = set(os.listdir(stage_dir))
+                except FileNotFoundError:
+                    continue
+                remote = self._remote_files(repo)
+                for filename in filenames:
+                    if filename.endswith('.txt'):
+                        if filename in remote:
+                            results[stage]['skipped'] += 1
+                            continue
+                        base_name = filename[:-4]
+                        # The listing already tells whether a .meta.json exists
+                        has_meta = f'{base_name}.meta.json' in filenames
+                        future = pool.submit(self._sync_text_file, stage_dir, base_name, upload_fn, has_meta)
+                        futures[future] = stage
+            
+            # Chunk folders
+            # scandir's entries know their type, so no stat per folder
+            folder_paths = {}
+            try:
+                with os.scandir(Config.APPROVED_CHUNKED_DIR) as it:
+                    for entry in it:
+                        # '.'-prefixed folders are being deleted in the background
+                        if not entry.name.startswith('.') and entry.is_dir():
+                            folder_paths[entry.name] = entry.path
+            except FileNotFoundError:
+                pass
+            # All folders share one job so their chunks can share commits
+            chunk_future = None
+            if folder_paths:
+                remote = self._remote_files(self.chunked_repo)
+                chunk_future = pool.submit(self._sync_chunk_folders, folder_paths, remote)
+            
+            for future in as_completed(futures):
+                stage = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error('Sync of a %s item failed: %s', stage, e)
+                    result = {'success': False}
+                if result is None:
+                    continue
+                if result.get('skipped'):
+                    results[stage]['skipped'] += 1
+                elif result['success']:
+                    results[stage]['success'] += 1
+                else:
+                    results[stage]['failed'] += 1
+            
+            if chunk_future is not None:
+                try:
+                    results['chunked'] = chunk_future.result()
+                except Exception as e:
+                    logger.error('Sync of the chunk folders failed: %s', e)
+                    results['chunked']['failed'] = len(folder_paths)
         
         return {
             'success': True,
@@ -29,6 +29,8 @@ import shutil
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from ..config import Config
+
 
 class StorageService:
     """
@@ -44,8 +46,6 @@ class StorageService:
         
         Sets up paths and ensures all required directories exist.
         """
-        from ..config import Config
-        
         # Store config reference
         self.config = Config
         
@@ -104,9 +104,11 @@ class StorageService:
                 content = f.read()
             
             metadata = {}
-            if os.path.exists(meta_path):
+            try:
                 with open(meta_path, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
+            except FileNotFoundError:
+                pass
             
             return {
                 'filename': filename,
@@ -145,8 +147,13 @@ class StorageService:
             # Chunked files are organized in folders
             for folder_name in os.listdir(base_dir):
                 folder_path = os.path.join(base_dir, folder_name)
-                if os.path.isdir(folder_path):
-                    chunk_count = len([f for f in os.listdir(folder_path) if f.endswith('.json')])
+                # '.'-prefixed folders are being deleted in the background
+                if not folder_name.startswith('.') and os.path.isdir(folder_path):
+                    # '_'-prefixed .json files are folder sidecars, not chunks
+                    chunk_count = len([
+                        f for f in os.listdir(folder_path)
+                        if f.endswith('.json') and not f.startswith('_')
+                    ])
                     files.append({
                         'filename': folder_name,
                         'chunk_count': chunk_count,
@@ -156,13 +163,15 @@ class StorageService:
             # Raw and cleaned files are single files
             for filename in os.listdir(base_dir):
                 if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
+                    base_name = filename[:-4]
                     meta_path = os.path.join(base_dir, f'{base_name}.meta.json')
                     
                     metadata = {'filename': base_name}
-                    if os.path.exists(meta_path):
+                    try:
                         with open(meta_path, 'r', encoding='utf-8') as f:
                             metadata = json.load(f)
+                    except FileNotFoundError:
+                        pass
                     
                     files.append(metadata)
         
@@ -359,12 +368,12 @@ class StorageService:
             meta_path = os.path.join(pending_dir, f'{filename}.meta.json')
             
             deleted = False
-            if os.path.exists(content_path):
-                os.remove(content_path)
-                deleted = True
-            if os.path.exists(meta_path):
-                os.remove(meta_path)
-                deleted = True
+            for path in (content_path, meta_path):
+                try:
+                    os.remove(path)
+                    deleted = True
+                except FileNotFoundError:
+                    pass
             
             return deleted
         
@@ -393,8 +402,12 @@ class StorageService:
                 count = 0
                 for folder in os.listdir(dir_path):
                     folder_path = os.path.join(dir_path, folder)
-                    if os.path.isdir(folder_path):
-                        count += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
+                    # Skip folders being deleted and '_' sidecars, as list_files does
+                    if not folder.startswith('.') and os.path.isdir(folder_path):
+                        count += len([
+                            f for f in os.listdir(folder_path)
+                            if f.endswith('.json') and not f.startswith('_')
+                        ])
                 stats[key] = count
             else:
                 # Count .txt files
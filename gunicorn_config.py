@@ -8,9 +8,45 @@ bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
 # trigger pushes concurrently without blocking each other.
 # Each worker spawns `threads` green-threads which share the process and the
 # file-lock logic in chunking.py.
-worker_class = 'gthread'
-workers = 2       # 2 processes × threads = total concurrent capacity
-threads = 4       # 4 threads per worker  → 8 simultaneous requests
+#
+# gevent (GUNICORN_WORKER_CLASS=gevent, needs `pip install gevent`) would keep
+# hundreds of idle HF round-trips per worker, but the blocking fcntl.flock in
+# chunking.py stalls a whole gevent worker while held, so gthread stays the
+# default. gunicorn's gevent worker monkey-patches before the app is loaded.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+
+# One process per usable CPU plus one, between 2 and 4; the threads below
+# cover I/O waits, so the classic 2×CPU+1 would mostly add memory on 512 MB
+# boxes. The CPU count comes from the container's cgroup quota when there is
+# one (a container sees every host CPU otherwise). WEB_CONCURRENCY overrides.
+# Every worker has its own thread pools, caches and HF_MAX_CONCURRENT_COMMITS.
+def _usable_cpus():
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:      # cgroup v2
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            return max(1, int(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:   # cgroup v1
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        if quota > 0:
+            return max(1, quota // period)
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+workers = int(os.getenv('WEB_CONCURRENCY', str(min(max(2, _usable_cpus() + 1), 4))))  # processes × threads = total concurrent capacity
+threads = int(os.getenv('GUNICORN_THREADS', '4'))  # 4 per worker
+if worker_class == 'gevent':
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '500'))
 
 # ── Timeouts ──────────────────────────────────────────────────────────────────
 # The push-to-HuggingFace endpoint can take up to a few minutes when pushing